@@ -5,8 +5,8 @@ from .exceptions import EntityNotFoundException, NotImplementedException, \
     MethodNotAllowedException, Entity, Message, app_exception_handler, \
     BaseAppException, PermissionDeniedException, UnauthorizedException
 from .utils import control_collision, check_night_reservation, \
-    control_available_reservation_time, modify_url_scheme
-from .user_authenticator import get_oauth_session, get_request, \
+    control_available_reservation_time, modify_url_scheme, schemas_response
+from .user_authenticator import get_oauth_session, get_request, get_request_content, \
     authenticate_user, get_current_user, get_current_token
 from .emails import send_email, preparing_email, create_email_meta
 from .access_card_system import add_or_update_access_to_reservation_areas, \
@@ -22,10 +22,10 @@ __all_ = [
 
     # Utils
     "control_collision", "check_night_reservation", "control_available_reservation_time",
-    "modify_url_scheme",
+    "modify_url_scheme", "schemas_response",
 
     # User authenticator
-    "get_oauth_session", "get_request", "authenticate_user", "get_current_user",
+    "get_oauth_session", "get_request", "get_request_content", "authenticate_user", "get_current_user",
     "get_current_token"
 
     # Emails
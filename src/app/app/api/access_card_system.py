@@ -87,7 +87,7 @@ async def add_var_symbol(
 
     :returns: The result from the API.
     """
-    data = await service.add_var_symbol(access_body)
+    data = service.add_var_symbol(access_body)
     return send_request(data)
 
 
@@ -104,7 +104,7 @@ async def del_var_symbol(
 
     :returns: The result from the API.
     """
-    data = await service.del_var_symbol(access_body)
+    data = service.del_var_symbol(access_body)
     return send_request(data)
 
 
@@ -118,7 +118,7 @@ async def get_groups_for_use(
     :param service: AccessCardSystemService ser.
     :returns: The result from the API.
     """
-    data = await service.get_groups_for_use()
+    data = service.get_groups_for_use()
     return send_request(data)
 
 
@@ -135,7 +135,7 @@ async def get_access_var_symbol(
 
     :returns: The result from the API.
     """
-    data = await service.get_access_var_symbol(var_symbol)
+    data = service.get_access_var_symbol(var_symbol)
     return send_request(data)
 
 
@@ -152,7 +152,7 @@ async def get_access_group(
 
     :returns: The result from the API.
     """
-    data = await service.get_access_group(group)
+    data = service.get_access_group(group)
     return send_request(data)
 
 
@@ -2,13 +2,15 @@
 API controllers for emails.
 """
 from typing import Any, Annotated
-import os
+from io import BytesIO
+from mimetypes import guess_type
 
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from fastapi_mail import FastMail, MessageSchema, MessageType
-from fastapi import APIRouter, status, Depends
-from api import get_current_token, get_request
+from fastapi import APIRouter, status, Depends, UploadFile
+from starlette.datastructures import Headers
+from api import get_current_token, get_request_content
 from schemas import EmailCreate, RegistrationFormCreate, UserIS, User, Event, \
     EmailMeta
 from models import ReservationServiceModel, CalendarModel
@@ -58,15 +60,12 @@ async def send_registration_form(
 
     :returns Dictionary: Confirming that the registration form has been sent.
     """
-    user_is = UserIS.model_validate(await get_request(token, "/users/me"))
+    user_is = UserIS.model_validate_json(await get_request_content(token, "/users/me"))
     full_name = user_is.first_name + " " + user_is.surname
-    email_create = service.prepare_registration_form(registration_form, full_name)
+    email_create = await service.prepare_registration_form(registration_form, full_name)
 
     await send_email(email_create)
 
-    if email_create.attachment and os.path.exists(email_create.attachment):
-        os.remove(email_create.attachment)
-
     return {"message": "Registration form has been sent"}
 
 
@@ -83,21 +82,27 @@ async def send_email(
 
     :returns Dictionary: Confirming that the email has been sent.
     """
+    attachments = []
+    if email_create.attachment:
+        content_type = guess_type(email_create.attachment_name or "")[0]
+        attachments.append(UploadFile(
+            file=BytesIO(email_create.attachment),
+            filename=email_create.attachment_name,
+            headers=Headers({"content-type": content_type or "application/octet-stream"})
+        ))
+
     message = MessageSchema(
         subject=email_create.subject,
         recipients=email_create.email,  # List of recipients
         body=email_create.body,
         subtype=MessageType.plain,
-        attachments=[email_create.attachment] if email_create.attachment else []
+        attachments=attachments
     )
 
     fm = FastMail(email_connection)
     # background_tasks.add_task(fm.send_message, message)
     await fm.send_message(message)
 
-    if email_create.attachment and os.path.exists(email_create.attachment):
-        os.remove(email_create.attachment)
-
     return {"message": "Email has been sent"}
 
 
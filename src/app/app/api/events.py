@@ -1,6 +1,7 @@
 """
 API controllers for events.
 """
+import asyncio
 from typing import Any, Annotated, List
 from dateutil.parser import isoparse
 from pytz import timezone
@@ -10,10 +11,10 @@ from googleapiclient.errors import HttpError
 from fastapi import APIRouter, Depends, status, Path, Body, Query
 from fastapi.responses import JSONResponse
 from models import EventState
-from schemas import EventCreate, ServiceList, User, Event, EventUpdate, \
+from schemas import EventCreate, SERVICES_ADAPTER, User, Event, EventUpdate, \
     EventUpdateTime, EventWithExtraDetails
 from services import EventService, CalendarService
-from api import get_request, fastapi_docs, \
+from api import get_request_content, fastapi_docs, \
     get_current_user, get_current_token, auth_google, control_collision, \
     check_night_reservation, control_available_reservation_time, \
     EntityNotFoundException, Entity, PermissionDeniedException, UnauthorizedException, \
@@ -54,10 +55,12 @@ async def create_event(
 
     :returns Event json object: the created event or exception otherwise.
     """
-    services = ServiceList(services=await get_request(
-        token, "/services/mine")).services
-
-    calendar = await calendar_service.get_by_reservation_type(event_create.reservation_type)
+    # The IS request doesn't touch the database, it runs while the calendar is looked up
+    services_content, calendar = await asyncio.gather(
+        get_request_content(token, "/services/mine"),
+        calendar_service.get_by_reservation_type(event_create.reservation_type)
+    )
+    services = SERVICES_ADAPTER.validate_json(services_content)
     if not calendar:
         raise EntityNotFoundException(Entity.CALENDAR, event_create.reservation_type)
     reservation_service = await calendar_service.get_reservation_service_of_this_calendar(
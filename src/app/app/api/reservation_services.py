@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Path, status, Body, Query
 
 from api import EntityNotFoundException, Entity, fastapi_docs, BaseAppException, \
     get_current_user, authenticate_user, get_current_token, PermissionDeniedException, \
-    UnauthorizedException
+    UnauthorizedException, schemas_response
 from schemas import ReservationServiceCreate, ReservationServiceUpdate, ReservationService, User
 from services import ReservationServiceService, UserService
 
@@ -116,7 +116,7 @@ async def get_reservation_service(
     reservation_service = await service.get(reservation_service_id, include_removed)
     if not reservation_service:
         raise EntityNotFoundException(Entity.RESERVATION_SERVICE, reservation_service_id)
-    return reservation_service
+    return ReservationService.from_orm_fast(reservation_service)
 
 
 @router.get("/",
@@ -148,7 +148,8 @@ async def get_reservation_services(
         reservation_service = await service.get_public_services()
     if reservation_service is None:
         raise BaseAppException()
-    return reservation_service
+    return schemas_response(ReservationService.from_orm_fast(item)
+                            for item in reservation_service)
 
 
 @router.get("/services/public",
@@ -171,7 +172,8 @@ async def get_public_reservation_services(
     reservation_service = await service.get_public_services()
     if reservation_service is None:
         raise BaseAppException()
-    return reservation_service
+    return schemas_response(ReservationService.from_orm_fast(item)
+                            for item in reservation_service)
 
 
 @router.put("/{reservation_service_id}",
@@ -294,7 +296,7 @@ async def get_reservation_service_by_name(
     reservation_service = await service.get_by_name(name, include_removed)
     if not reservation_service:
         raise EntityNotFoundException(Entity.RESERVATION_SERVICE, name)
-    return reservation_service
+    return ReservationService.from_orm_fast(reservation_service)
 
 
 @router.get("/alias/{alias}",
@@ -321,4 +323,4 @@ async def get_reservation_service_by_alias(
     reservation_service = await service.get_by_alias(alias, include_removed)
     if not reservation_service:
         raise EntityNotFoundException(Entity.RESERVATION_SERVICE, alias)
-    return reservation_service
+    return ReservationService.from_orm_fast(reservation_service)
@@ -6,7 +6,7 @@ from typing import Annotated, Any
 from fastapi import HTTPException, status, Depends, Request
 from requests_oauthlib import OAuth2Session
 from services import UserService
-from schemas import UserIS, RoleList, ServiceList, Room
+from schemas import UserIS, Room, ROLES_ADAPTER, SERVICES_ADAPTER
 from core import settings
 
 import httpx
@@ -27,14 +27,14 @@ def get_oauth_session():
                          redirect_uri=settings.REDIRECT_URI)
 
 
-async def get_request(token: str, request: str):
+async def get_response(token: str, request: str) -> httpx.Response:
     """
     Make an authenticated GET request to the IS.
 
     :param token: The authorization token.
     :param request: The API endpoint to request data.
 
-    :return: The JSON response from the API.
+    :return: The response from the API.
     """
     info_endpoint = settings.IS_SCOPES + request
 
@@ -50,9 +50,33 @@ async def get_request(token: str, request: str):
 
         response.raise_for_status()
 
-        response_data = response.json()
+    return response
+
 
-    return response_data
+async def get_request(token: str, request: str):
+    """
+    Make an authenticated GET request to the IS.
+
+    :param token: The authorization token.
+    :param request: The API endpoint to request data.
+
+    :return: The JSON response from the API.
+    """
+    response = await get_response(token, request)
+    return response.json()
+
+
+async def get_request_content(token: str, request: str) -> bytes:
+    """
+    Make an authenticated GET request to the IS.
+
+    :param token: The authorization token.
+    :param request: The API endpoint to request data.
+
+    :return: The raw JSON body of the response, to be validated by the schemas directly.
+    """
+    response = await get_response(token, request)
+    return response.content
 
 
 async def authenticate_user(user_service: Annotated[UserService, Depends(UserService)],
@@ -65,11 +89,11 @@ async def authenticate_user(user_service: Annotated[UserService, Depends(UserSer
 
      :return: The authenticated user object if successful, otherwise Exception.
      """
-    user_data = UserIS.model_validate(await get_request(token, "/users/me"))
-    roles = RoleList(roles=await get_request(token, "/user_roles/mine")).roles
-    services = ServiceList(services=await get_request(token,
-                                                      "/services/mine")).services
-    room = Room.model_validate(await get_request(token, "/rooms/mine"))
+    user_data = UserIS.model_validate_json(await get_request_content(token, "/users/me"))
+    roles = ROLES_ADAPTER.validate_json(await get_request_content(token, "/user_roles/mine"))
+    services = SERVICES_ADAPTER.validate_json(
+        await get_request_content(token, "/services/mine"))
+    room = Room.model_validate_json(await get_request_content(token, "/rooms/mine"))
     return await user_service.create_user(user_data, roles, services, room)
 
 
@@ -117,7 +141,9 @@ async def get_current_user(
     if not user:
         raise credentials_exception
     token = request.session['oauth_token']['access_token']
-    user_is = UserIS.model_validate(await get_request(token, "/users/me"))
+    # The IS answer only confirms the token is still valid, nothing of it is stored,
+    # so it is not validated field by field on every request
+    user_is = await get_request(token, "/users/me")
     if not user_is:
         raise credentials_exception
     return user
@@ -3,12 +3,12 @@ API controllers for authorisation in IS(Information System of the Buben club)
 and users itself.
 """
 from typing import Annotated, Any, List
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, Request
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, Request, Path, Query
 from fastapi.responses import JSONResponse, RedirectResponse
-from services import UserService
+from services import UserService, EventService
 from api import authenticate_user, fastapi_docs, get_oauth_session, get_current_user, \
-    modify_url_scheme
-from schemas import User
+    modify_url_scheme, schemas_response
+from schemas import User, EventsPage
 from core import settings
 
 app = FastAPI()
@@ -92,16 +92,19 @@ async def callback(
 @router.get("/me",
             response_model=User)
 async def get_user(
+        user_service: Annotated[UserService, Depends(UserService)],
         current_user: Annotated[User, Depends(get_current_user)]
 ) -> Any:
     """
      Get currently authenticated user.
 
+     :param user_service: User service.
      :param current_user: Current user.
 
      :return: Current user.
      """
-    return current_user
+    user = await user_service.get_with_events(current_user.id)
+    return User.from_orm_fast(user)
 
 
 @router.get("/",
@@ -124,7 +127,28 @@ async def get_all_users(
                 "message": "No users in db."
             }
         )
-    return users
+    return schemas_response(User.from_orm_fast(user) for user in users)
+
+
+@router.get("/{user_id}/events",
+            response_model=EventsPage)
+async def get_user_events(
+        event_service: Annotated[EventService, Depends(EventService)],
+        user_id: Annotated[int, Path()],
+        cursor: Annotated[str | None, Query()] = None,
+        limit: Annotated[int, Query(ge=1, le=100)] = 50,
+) -> Any:
+    """
+    Get one page of user events, newest first.
+
+    :param event_service: Event service.
+    :param user_id: user id of the events.
+    :param cursor: Cursor of the page from the previous response.
+    :param limit: Maximum number of the events in the page.
+
+    :return: Page of events with cursor of the next page.
+    """
+    return await event_service.get_page_by_user_id(user_id, limit, cursor)
 
 
 @router.get("/logout")
@@ -2,10 +2,16 @@
 Utils for API.
 """
 import datetime as dt
+from typing import Iterable
 from urllib.parse import urlparse, urlunparse
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from pytz import timezone
 from schemas import User, Calendar, EventCreate
 
+# Time zone of the reservations, looked up once
+_PRAGUE = timezone("Europe/Prague")
+
 
 def modify_url_scheme(url: str, new_scheme: str) -> str:
     """
@@ -26,6 +32,20 @@ def modify_url_scheme(url: str, new_scheme: str) -> str:
     return new_url
 
 
+def schemas_response(schemas: Iterable[BaseModel]) -> ORJSONResponse:
+    """
+    Serialize response schemas straight into ORJSON response.
+
+    Returning a response skips `jsonable_encoder` and the validation
+    against `response_model`, which is kept only for the documentation.
+
+    :param schemas: Response schemas to return.
+
+    :return: ORJSON response with the serialized schemas.
+    """
+    return ORJSONResponse(content=[schema.model_dump(mode="json") for schema in schemas])
+
+
 def control_collision(
         google_calendar_service,
         event_input: EventCreate,
@@ -73,10 +93,8 @@ def get_events(service, start_time, end_time, calendar_id):
 
     :return: List of the events for that time
     """
-    prague = timezone("Europe/Prague")
-
-    start_time_str = prague.localize(start_time).isoformat()
-    end_time_str = prague.localize(end_time).isoformat()
+    start_time_str = _PRAGUE.localize(start_time).isoformat()
+    end_time_str = _PRAGUE.localize(end_time).isoformat()
 
     # Call the Calendar API
     events_result = service.events().list(
@@ -122,8 +140,8 @@ def check_collision_time(check_collision, start_datetime,
     start_date_event = dt.datetime.fromisoformat(str(check_collision[0]['start']['dateTime']))
     end_date_event = dt.datetime.fromisoformat(str(check_collision[0]['end']['dateTime']))
 
-    if end_date_event == start_date.astimezone(timezone('Europe/Prague')) \
-            or start_date_event == end_date.astimezone(timezone('Europe/Prague')):
+    if end_date_event == start_date.astimezone(_PRAGUE) \
+            or start_date_event == end_date.astimezone(_PRAGUE):
         return True
 
     return False
@@ -21,6 +21,10 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int
     SQLALCHEMY_SCHEME: str
     POSTGRES_DATABASE_URI: PostgresDsn | None = None
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: int = 30
+    POSTGRES_POOL_RECYCLE: int = 3600
 
     SECRET_KEY: str
 
@@ -4,12 +4,12 @@ for handling common database operations with SQLAlchemy and FastAPI.
 """
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import TypeVar, Generic, Type, Any
+from typing import TypeVar, Generic, Type, Any, Collection
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import Base
@@ -33,6 +33,24 @@ class AbstractCRUDBase(Generic[Model, CreateSchema, UpdateSchema], ABC):
         including marked as deleted.
         """
 
+    @abstractmethod
+    async def get_by_id(self, uuid: UUID | str | int | None,
+                        include_removed: bool = False) -> Model | None:
+        """
+        Retrieve a single record by its primary key through the session
+        identity map, so a record already loaded in this session
+        is returned without another round-trip to the database.
+        If include_removed is True retrieve a single record
+        including marked as deleted.
+        """
+
+    @abstractmethod
+    async def get_many(self, ids: Collection[UUID | str | int]) -> list[Model]:
+        """
+        Retrieve the records with the given UUIDs in one query.
+        Records which are not found are left out.
+        """
+
     @abstractmethod
     async def get_multi(self, skip: int = 0, limit: int = 100) -> list[Model]:
         """
@@ -64,12 +82,30 @@ class AbstractCRUDBase(Generic[Model, CreateSchema, UpdateSchema], ABC):
         Create a new record from the input scheme.
         """
 
+    @abstractmethod
+    async def create_in_savepoint(self, obj_in: CreateSchema) -> Model:
+        """
+        Create a new record from the input scheme inside a savepoint.
+        If the insert fails, only the savepoint is rolled back and
+        the objects already loaded in the session stay usable.
+        """
+
     @abstractmethod
     async def update(self, *, db_obj: Model | None, obj_in: UpdateSchema) -> Model | None:
         """
         Update an existing record with the input scheme.
         """
 
+    @abstractmethod
+    async def update_returning(self, uuid: UUID | str | int | None,
+                               values: dict[str, Any],
+                               *preconditions: ColumnElement[bool]) -> Model | None:
+        """
+        Update a record by its UUID in one UPDATE ... RETURNING statement,
+        only if it is not soft removed and matches all the preconditions.
+        Return None if no record was updated.
+        """
+
     @abstractmethod
     async def retrieve_removed_object(self, uuid: UUID | str | int | None
                                 ) -> Model | None:
@@ -111,6 +147,24 @@ class CRUDBase(AbstractCRUDBase[Model, CreateSchema, UpdateSchema]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_id(self, uuid: UUID | str | int | None,
+                        include_removed: bool = False) -> Model | None:
+        if uuid is None:
+            return None
+        obj = await self.db.get(self.model, uuid)
+        if obj is None:
+            # Soft deleted rows are filtered out of the identity lookup
+            return await self.get(uuid, True) if include_removed else None
+        if not include_removed and obj.deleted_at is not None:
+            return None
+        return obj
+
+    async def get_many(self, ids: Collection[UUID | str | int]) -> list[Model]:
+        if not ids:
+            return []
+        stmt = select(self.model).filter(self.model.id.in_(ids))
+        return list((await self.db.scalars(stmt)).all())
+
     async def get_multi(self, skip: int = 0, limit: int = 100) -> list[Model]:
         stmt = select(self.model).order_by(self.model.id.desc()).offset(skip).limit(limit)
         result = await self.db.execute(stmt)
@@ -140,6 +194,16 @@ class CRUDBase(AbstractCRUDBase[Model, CreateSchema, UpdateSchema]):
         await self.db.refresh(db_obj)
         return db_obj
 
+    async def create_in_savepoint(self, obj_in: CreateSchema | dict[str, Any]) -> Model:
+        obj_in_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+        db_obj = self.model(**obj_in_data)
+        async with self.db.begin_nested():
+            self.db.add(db_obj)
+            await self.db.flush()
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
     async def update(self, *,
                      db_obj: Model | None,
                      obj_in: UpdateSchema | dict[str, Any]) -> Model | None:
@@ -158,6 +222,22 @@ class CRUDBase(AbstractCRUDBase[Model, CreateSchema, UpdateSchema]):
         await self.db.refresh(db_obj)
         return db_obj
 
+    async def update_returning(self, uuid: UUID | str | int | None,
+                               values: dict[str, Any],
+                               *preconditions: ColumnElement[bool]) -> Model | None:
+        if uuid is None:
+            return None
+        # Soft delete rewrites only SELECTs, removed rows are excluded here
+        stmt = (update(self.model)
+                .where(self.model.id == uuid, self.model.deleted_at.is_(None),
+                       *preconditions)
+                .values(**values)
+                .returning(self.model))
+        obj = (await self.db.scalars(
+            stmt, execution_options={"populate_existing": True})).one_or_none()
+        await self.db.commit()
+        return obj
+
     async def retrieve_removed_object(self, uuid: UUID | str | int | None
                                 ) -> Model | None:
         if uuid is None:
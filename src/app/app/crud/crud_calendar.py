@@ -4,14 +4,42 @@ abstract base class (AbstractCRUDCalendar) and a concrete implementation (CRUDCa
 using SQLAlchemy.
 """
 from abc import ABC, abstractmethod
+from typing import Sequence
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, bindparam, exists, and_, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import CalendarModel
+from models import CalendarModel, ReservationServiceModel
 from schemas import CalendarCreate, CalendarUpdate
 
 from crud import CRUDBase
 
+# Both variants of the lookup are built once, the include_removed flag only
+# selects between them
+_SEL_BY_RESERVATION_TYPE = select(CalendarModel).where(
+    CalendarModel.reservation_type == bindparam("reservation_type"))
+_SEL_BY_RESERVATION_TYPE_INCL_DELETED = _SEL_BY_RESERVATION_TYPE.execution_options(
+    include_deleted=True)
+
+# Two EXISTS probes answered in one round trip, no calendar row is fetched
+_SEL_ID_OR_TYPE_EXISTS = select(
+    exists().where(CalendarModel.id == bindparam("id")),
+    exists().where(CalendarModel.reservation_type == bindparam("reservation_type"))
+).execution_options(include_deleted=True)
+
+
+# Calendar with its live reservation service in one query. The soft delete filter
+# of the service is in the join condition, so a removed service gives None
+# instead of hiding the calendar
+_SEL_WITH_RESERVATION_SERVICE_INCL_DELETED = select(
+    CalendarModel, ReservationServiceModel
+).outerjoin(ReservationServiceModel, and_(
+    ReservationServiceModel.id == CalendarModel.reservation_service_id,
+    ReservationServiceModel.deleted_at.is_(None)
+)).where(CalendarModel.id == bindparam("id")).execution_options(include_deleted=True)
+_SEL_WITH_RESERVATION_SERVICE = _SEL_WITH_RESERVATION_SERVICE_INCL_DELETED.where(
+    CalendarModel.deleted_at.is_(None))
+
 
 class AbstractCRUDCalendar(CRUDBase[
                                CalendarModel,
@@ -36,6 +64,86 @@ class AbstractCRUDCalendar(CRUDBase[
         :return: The Calendar instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def exists_by_id_or_type(self, calendar_id: str,
+                                   reservation_type: str) -> str | None:
+        """
+        Checks in one query whether a Calendar, including removed ones,
+        already uses the id or the reservation type.
+
+        :param calendar_id: The id of the Calendar.
+        :param reservation_type: The reservation type of the Calendar.
+
+        :return: "id" or "reservation_type" by the conflicting field, None otherwise.
+        """
+
+    @abstractmethod
+    async def get_with_reservation_service(
+            self, calendar_id: str,
+            include_removed: bool = False
+    ) -> tuple[CalendarModel, ReservationServiceModel | None] | None:
+        """
+        Retrieves a Calendar instance together with its Reservation Service
+        in one query. A removed Reservation Service is never returned.
+
+        :param calendar_id: The id of the Calendar.
+        :param include_removed: Include removed Calendar or not.
+
+        :return: The Calendar and its Reservation Service or None
+        if the Reservation Service isn't found, None if the Calendar isn't found.
+        """
+
+    @abstractmethod
+    async def existing_ids(self, ids: Sequence[str]) -> set[str]:
+        """
+        Retrieves which of the given ids belong to existing Calendars.
+
+        :param ids: The ids of the Calendars.
+
+        :return: The ids of the found Calendars.
+        """
+
+    @abstractmethod
+    async def remove_from_collisions(self, calendar_id: str,
+                                     reservation_service_id: UUID) -> None:
+        """
+        Removes the Calendar id from collisions of the Calendars
+        of the Reservation Service in one statement. The change is not committed,
+        it is committed together with the next change in the session.
+
+        :param calendar_id: The id of the Calendar to remove from collisions.
+        :param reservation_service_id: The id of the Reservation Service.
+        """
+
+    @abstractmethod
+    async def remove_mini_service(self, name: str,
+                                  reservation_service_id: UUID) -> list[str]:
+        """
+        Removes the Mini Service name from the Calendars of the Reservation
+        Service in one statement. The change is not committed,
+        it is committed together with the next change in the session.
+
+        :param name: The name of the Mini Service to remove.
+        :param reservation_service_id: The id of the Reservation Service.
+
+        :return: Ids of the changed Calendars.
+        """
+
+    @abstractmethod
+    async def create_with_collisions(
+            self, calendar_create: CalendarCreate,
+            collision_calendars: Sequence[CalendarModel]
+    ) -> CalendarModel:
+        """
+        Creates a Calendar and adds it to collisions of the given Calendars
+        in one transaction.
+
+        :param calendar_create: The Calendar to create.
+        :param collision_calendars: Calendars colliding with the created one.
+
+        :return: The created Calendar.
+        """
+
 
 class CRUDCalendar(AbstractCRUDCalendar):
     """
@@ -49,8 +157,70 @@ class CRUDCalendar(AbstractCRUDCalendar):
 
     async def get_by_reservation_type(self, reservation_type: str,
                                 include_removed: bool = False) -> CalendarModel | None:
-        stmt = select(self.model).where(self.model.reservation_type == reservation_type)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
+        stmt = _SEL_BY_RESERVATION_TYPE_INCL_DELETED if include_removed \
+            else _SEL_BY_RESERVATION_TYPE
+        result = await self.db.execute(stmt, {"reservation_type": reservation_type})
         return result.scalars().first()
+
+    async def exists_by_id_or_type(self, calendar_id: str,
+                                   reservation_type: str) -> str | None:
+        id_exists, type_exists = (await self.db.execute(_SEL_ID_OR_TYPE_EXISTS, {
+            "id": calendar_id, "reservation_type": reservation_type})).one()
+        if id_exists:
+            return "id"
+        if type_exists:
+            return "reservation_type"
+        return None
+
+    async def get_with_reservation_service(
+            self, calendar_id: str,
+            include_removed: bool = False
+    ) -> tuple[CalendarModel, ReservationServiceModel | None] | None:
+        stmt = _SEL_WITH_RESERVATION_SERVICE_INCL_DELETED if include_removed \
+            else _SEL_WITH_RESERVATION_SERVICE
+        row = (await self.db.execute(stmt, {"id": calendar_id})).first()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def existing_ids(self, ids: Sequence[str]) -> set[str]:
+        if not ids:
+            return set()
+        stmt = select(self.model.id).where(self.model.id.in_(ids))
+        return set((await self.db.scalars(stmt)).all())
+
+    async def remove_from_collisions(self, calendar_id: str,
+                                     reservation_service_id: UUID) -> None:
+        stmt = update(self.model).where(
+            self.model.reservation_service_id == reservation_service_id,
+            # Containment, unlike = ANY, can use the GIN index of the column
+            self.model.collision_with_calendar.contains([calendar_id])
+        ).values(collision_with_calendar=func.array_remove(
+            self.model.collision_with_calendar, calendar_id
+        )).execution_options(synchronize_session="fetch")
+        await self.db.execute(stmt)
+
+    async def remove_mini_service(self, name: str,
+                                  reservation_service_id: UUID) -> list[str]:
+        stmt = update(self.model).where(
+            self.model.reservation_service_id == reservation_service_id,
+            self.model.mini_services.contains([name])
+        ).values(mini_services=func.array_remove(
+            self.model.mini_services, name
+        )).returning(self.model.id).execution_options(synchronize_session="fetch")
+        return list((await self.db.scalars(stmt)).all())
+
+    async def create_with_collisions(
+            self, calendar_create: CalendarCreate,
+            collision_calendars: Sequence[CalendarModel]
+    ) -> CalendarModel:
+        for collision_calendar in collision_calendars:
+            collisions = collision_calendar.collision_with_calendar or []
+            if calendar_create.id not in collisions:
+                # New list, so the change of the array column is tracked
+                collision_calendar.collision_with_calendar = [*collisions, calendar_create.id]
+        db_obj = self.model(**calendar_create.model_dump())
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
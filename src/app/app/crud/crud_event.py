@@ -5,16 +5,40 @@ using SQLAlchemy.
 """
 from datetime import datetime
 from abc import ABC, abstractmethod
+from typing import Any, Collection
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, and_, select, tuple_
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import EventModel, EventState, CalendarModel
+from models import EventModel, EventState, CalendarModel, ReservationServiceModel, \
+    UserModel
 from schemas import EventCreateToDb, EventUpdate
 from crud import CRUDBase
 
 
+# Events with the names of their calendar, user and reservation service,
+# projected in one query straight into the listed values. The soft delete filter
+# is in the join conditions, so a removed related row gives None.
+_SEL_WITH_DETAILS = select(
+    EventModel.id, EventModel.purpose, EventModel.guests, EventModel.email,
+    EventModel.start_datetime, EventModel.end_datetime, EventModel.event_state,
+    EventModel.additional_services, EventModel.user_id, EventModel.calendar_id,
+    CalendarModel.reservation_type,
+    UserModel.full_name.label("user_name"),
+    ReservationServiceModel.name.label("reservation_service_name")
+).select_from(EventModel).outerjoin(CalendarModel, and_(
+    CalendarModel.id == EventModel.calendar_id,
+    CalendarModel.deleted_at.is_(None)
+)).outerjoin(UserModel, and_(
+    UserModel.id == EventModel.user_id,
+    UserModel.deleted_at.is_(None)
+)).outerjoin(ReservationServiceModel, and_(
+    ReservationServiceModel.id == CalendarModel.reservation_service_id,
+    ReservationServiceModel.deleted_at.is_(None)
+)).where(EventModel.deleted_at.is_(None)).execution_options(include_deleted=True)
+
+
 class AbstractCRUDEvent(CRUDBase[
                             EventModel,
                             EventCreateToDb,
@@ -27,43 +51,71 @@ class AbstractCRUDEvent(CRUDBase[
     """
 
     @abstractmethod
-    async def get_by_user_id(
+    async def get_details_by_user_id(
+            self, user_id: int,
+    ) -> list[Row]:
+        """
+        Retrieves the Events by user id with the reservation type, the user name
+        and the reservation service name, newest first.
+
+        :param user_id: user id of the events.
+
+        :return: Rows of the event values and the names.
+        """
+
+    @abstractmethod
+    async def get_page_by_user_id(
             self, user_id: int,
-    ) -> list[EventModel] | None:
+            limit: int,
+            after: tuple[datetime, str] | None = None,
+    ) -> list[EventModel]:
         """
-        Retrieves the Events instance by user id.
+        Retrieves one page of the Events by user id, newest first.
 
         :param user_id: user id of the events.
+        :param limit: Maximum number of the events.
+        :param after: (start_datetime, id) of the last event
+        of the previous page or None for the first page.
 
-        :return: Events with user id equal
-        to user id or None if no such events exists.
+        :return: Events with user id equal to user id.
         """
 
     @abstractmethod
-    async def get_by_event_state_by_reservation_service_id(
+    async def get_details_by_event_state_by_reservation_service_id(
             self, reservation_service_id: UUID,
             event_state: EventState,
-    ) -> list[EventModel]:
+    ) -> list[Row]:
         """
-        Retrieves the Events instance by reservation service id.
+        Retrieves the Events by reservation service id and state with
+        the reservation type, the user name and the reservation service name,
+        newest first.
 
         :param reservation_service_id: reservation service id of the events.
         :param event_state: event state of the event.
 
-        :return: Events with reservation service id equal
-        to reservation service id or empty list if no such events exists.
+        :return: Rows of the event values and the names.
         """
 
     @abstractmethod
-    async def confirm_event(
-            self, uuid: str | None,
+    async def transition_state(
+            self, uuid: str,
+            from_states: Collection[EventState],
+            values: dict[str, Any],
+            not_started_at: datetime | None = None,
+            manager_roles: Collection[str] | None = None
     ) -> EventModel | None:
         """
-        Confirm event.
+        Update the Event in one statement, only if it is still in one
+        of the given states, so the check and the change can't race.
 
-        :param uuid: The ID of the event to confirm.
+        :param uuid: The ID of the event to update.
+        :param from_states: States from which the event can be updated.
+        :param values: New values of the event attributes.
+        :param not_started_at: Update only the event which hasn't started at this time.
+        :param manager_roles: Update only the event of the Reservation Service
+        managed by one of these roles.
 
-        :return: the updated Event.
+        :return: the updated Event or None if it isn't in the given states.
         """
 
     @abstractmethod
@@ -90,46 +142,62 @@ class CRUDEvent(AbstractCRUDEvent):
     def __init__(self, db: AsyncSession):
         super().__init__(EventModel, db)
 
-    async def get_by_user_id(
+    async def get_details_by_user_id(
             self, user_id: int
-    ) -> list[EventModel] | None:
-        stmt = (select(self.model).filter(self.model.user_id == user_id)
+    ) -> list[Row]:
+        stmt = (_SEL_WITH_DETAILS.where(self.model.user_id == user_id)
                 .order_by(self.model.start_datetime.desc()))
         result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def get_page_by_user_id(
+            self, user_id: int,
+            limit: int,
+            after: tuple[datetime, str] | None = None,
+    ) -> list[EventModel]:
+        stmt = select(self.model).filter(self.model.user_id == user_id)
+        if after is not None:
+            stmt = stmt.filter(tuple_(self.model.start_datetime, self.model.id) < tuple_(*after))
+        stmt = (stmt.order_by(self.model.start_datetime.desc(), self.model.id.desc())
+                .limit(limit))
+        result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_by_event_state_by_reservation_service_id(
+    async def get_details_by_event_state_by_reservation_service_id(
             self, reservation_service_id: UUID,
             event_state: EventState,
-    ) -> list[EventModel]:
+    ) -> list[Row]:
         stmt = (
-            select(self.model)
-            .join(CalendarModel, self.model.calendar_id == CalendarModel.id)
-            .filter(
+            _SEL_WITH_DETAILS
+            .where(
                 CalendarModel.reservation_service_id == reservation_service_id,
                 self.model.event_state == event_state
             )
-            .options(joinedload(self.model.calendar))
             .order_by(self.model.start_datetime.desc())
         )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
-
-    async def confirm_event(
-            self, uuid: str | None,
+        return list(result.all())
+
+    async def transition_state(
+            self, uuid: str,
+            from_states: Collection[EventState],
+            values: dict[str, Any],
+            not_started_at: datetime | None = None,
+            manager_roles: Collection[str] | None = None
     ) -> EventModel | None:
-        if uuid is None:
-            return None
-        stmt = select(self.model).filter(
-            self.model.id == uuid)
-        result = await self.db.execute(stmt)
-        obj = result.scalar_one_or_none()
-        if obj is None:
-            return None
-        obj.event_state = EventState.CONFIRMED
-        self.db.add(obj)
-        await self.db.commit()
-        return obj
+        preconditions = [self.model.event_state.in_(from_states)]
+        if not_started_at is not None:
+            preconditions.append(self.model.start_datetime > not_started_at)
+        if manager_roles is not None:
+            preconditions.append(self.model.calendar_id.in_(
+                select(CalendarModel.id)
+                .join(ReservationServiceModel,
+                      CalendarModel.reservation_service_id == ReservationServiceModel.id)
+                .where(CalendarModel.deleted_at.is_(None),
+                       ReservationServiceModel.deleted_at.is_(None),
+                       ReservationServiceModel.alias.in_(manager_roles))
+            ))
+        return await self.update_returning(uuid, values, *preconditions)
 
     async def get_current_event_for_user(
             self, user_id: int
@@ -141,8 +209,10 @@ class CRUDEvent(AbstractCRUDEvent):
             .filter(
                 self.model.user_id == user_id,
                 self.model.start_datetime <= now,
-                self.model.end_datetime >= now
+                self.model.end_datetime >= now,
+                self.model.event_state != EventState.CANCELED
             )
+            .options(joinedload(self.model.calendar))
             .order_by(self.model.start_datetime.desc())
             .limit(1)
         )
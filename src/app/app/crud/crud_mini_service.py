@@ -4,15 +4,40 @@ abstract base class (AbstractCRUDMiniService) and a concrete implementation (CRU
 using SQLAlchemy.
 """
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import MiniServiceModel
+from models import MiniServiceModel, ReservationServiceModel
 from schemas import MiniServiceCreate, MiniServiceUpdate
 
 from crud import CRUDBase
 
+# Both variants of each lookup are built once, the include_removed flag only
+# selects between them
+_SEL_BY_NAME = select(MiniServiceModel).where(MiniServiceModel.name == bindparam("name"))
+_SEL_BY_NAME_INCL_DELETED = _SEL_BY_NAME.execution_options(include_deleted=True)
+
+_SEL_BY_NAMES = select(MiniServiceModel).where(
+    MiniServiceModel.name.in_(bindparam("names", expanding=True)))
+
+_SEL_BY_ROOM_ID = select(MiniServiceModel).where(
+    MiniServiceModel.room_id == bindparam("room_id"))
+_SEL_BY_ROOM_ID_INCL_DELETED = _SEL_BY_ROOM_ID.execution_options(include_deleted=True)
+
+# The soft delete filter would only apply to the mini service, the removal
+# of the service is in the join condition, so a removed service gives None
+# instead of hiding the mini service
+_SEL_WITH_RESERVATION_SERVICE_INCL_DELETED = select(
+    MiniServiceModel, ReservationServiceModel
+).outerjoin(ReservationServiceModel, and_(
+    ReservationServiceModel.id == MiniServiceModel.reservation_service_id,
+    ReservationServiceModel.deleted_at.is_(None)
+)).where(MiniServiceModel.id == bindparam("id")).execution_options(include_deleted=True)
+_SEL_WITH_RESERVATION_SERVICE = _SEL_WITH_RESERVATION_SERVICE_INCL_DELETED.where(
+    MiniServiceModel.deleted_at.is_(None))
+
 
 class AbstractCRUDMiniService(CRUDBase[
                                   MiniServiceModel,
@@ -37,6 +62,16 @@ class AbstractCRUDMiniService(CRUDBase[
         :return: The Mini Service instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def get_by_names(self, names: Sequence[str]) -> dict[str, MiniServiceModel]:
+        """
+        Retrieves Mini Service instances by their names in one query.
+
+        :param names: The names of the Mini Services.
+
+        :return: The found Mini Service instances keyed by their name.
+        """
+
     @abstractmethod
     async def get_by_room_id(
             self, room_id: int,
@@ -51,6 +86,22 @@ class AbstractCRUDMiniService(CRUDBase[
         :return: The Mini Service instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def get_with_reservation_service(
+            self, uuid: UUID,
+            include_removed: bool = False
+    ) -> tuple[MiniServiceModel, ReservationServiceModel | None] | None:
+        """
+        Retrieves a Mini Service instance together with its Reservation Service
+        in one query. A removed Reservation Service is never returned.
+
+        :param uuid: The uuid of the Mini Service.
+        :param include_removed: Include removed Mini Service or not.
+
+        :return: The Mini Service and its Reservation Service or None
+        if the Reservation Service isn't found, None if the Mini Service isn't found.
+        """
+
     @abstractmethod
     async def get_names_by_reservation_service_id(
             self, reservation_service_id: UUID
@@ -77,22 +128,35 @@ class CRUDMiniService(AbstractCRUDMiniService):
 
     async def get_by_name(self, name: str,
                           include_removed: bool = False) -> MiniServiceModel | None:
-        stmt = select(self.model).where(self.model.name == name)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
+        stmt = _SEL_BY_NAME_INCL_DELETED if include_removed else _SEL_BY_NAME
+        result = await self.db.execute(stmt, {"name": name})
         return result.scalar_one_or_none()
 
+    async def get_by_names(self, names: Sequence[str]) -> dict[str, MiniServiceModel]:
+        if not names:
+            return {}
+        result = await self.db.execute(_SEL_BY_NAMES, {"names": list(names)})
+        return {mini_service.name: mini_service for mini_service in result.scalars()}
+
     async def get_by_room_id(
             self, room_id: int,
             include_removed: bool = False
     ) -> MiniServiceModel | None:
-        stmt = select(self.model).where(self.model.room_id == room_id)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
+        stmt = _SEL_BY_ROOM_ID_INCL_DELETED if include_removed else _SEL_BY_ROOM_ID
+        result = await self.db.execute(stmt, {"room_id": room_id})
         return result.scalar_one_or_none()
 
+    async def get_with_reservation_service(
+            self, uuid: UUID,
+            include_removed: bool = False
+    ) -> tuple[MiniServiceModel, ReservationServiceModel | None] | None:
+        stmt = _SEL_WITH_RESERVATION_SERVICE_INCL_DELETED if include_removed \
+            else _SEL_WITH_RESERVATION_SERVICE
+        row = (await self.db.execute(stmt, {"id": uuid})).first()
+        if row is None:
+            return None
+        return row[0], row[1]
+
     async def get_names_by_reservation_service_id(
             self, reservation_service_id: UUID
     ) -> list[str]:
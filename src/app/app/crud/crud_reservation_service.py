@@ -4,14 +4,51 @@ abstract base class (AbstractCRUDReservationService) and a concrete implementati
 (CRUDReservationService) using SQLAlchemy.
 """
 from abc import ABC, abstractmethod
+from collections import defaultdict
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, bindparam
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import ReservationServiceModel
+from models import ReservationServiceModel, CalendarModel, MiniServiceModel
 from schemas import ReservationServiceCreate, ReservationServiceUpdate
 
 from crud import CRUDBase
 
+# Both variants of each lookup are built once, the include_removed flag only
+# selects between them
+_SEL_BY_NAME = select(ReservationServiceModel).filter(
+    ReservationServiceModel.name == bindparam("name"))
+_SEL_BY_NAME_INCL_DELETED = _SEL_BY_NAME.execution_options(include_deleted=True)
+
+_SEL_BY_ALIAS = select(ReservationServiceModel).filter(
+    ReservationServiceModel.alias == bindparam("alias"))
+_SEL_BY_ALIAS_INCL_DELETED = _SEL_BY_ALIAS.execution_options(include_deleted=True)
+
+_SEL_DETAIL_BY_ALIAS = _SEL_BY_ALIAS.options(
+    selectinload(ReservationServiceModel.calendars),
+    selectinload(ReservationServiceModel.mini_services)
+)
+_SEL_DETAIL_BY_ALIAS_INCL_DELETED = _SEL_DETAIL_BY_ALIAS.execution_options(
+    include_deleted=True)
+
+_SEL_BY_ROOM_ID = select(ReservationServiceModel).filter(
+    ReservationServiceModel.room_id == bindparam("room_id"))
+_SEL_BY_ROOM_ID_INCL_DELETED = _SEL_BY_ROOM_ID.execution_options(include_deleted=True)
+
+_SEL_PUBLIC = select(ReservationServiceModel).filter(
+    ReservationServiceModel.public
+).options(
+    selectinload(ReservationServiceModel.calendars),
+    selectinload(ReservationServiceModel.mini_services)
+)
+_SEL_PUBLIC_INCL_DELETED = _SEL_PUBLIC.execution_options(include_deleted=True)
+
+_SEL_NAME_OR_ALIAS_EXISTS = select(
+    exists().where(ReservationServiceModel.name == bindparam("name")),
+    exists().where(ReservationServiceModel.alias == bindparam("alias"))
+).execution_options(include_deleted=True)
+
 
 class AbstractCRUDReservationService(CRUDBase[
                                          ReservationServiceModel,
@@ -48,6 +85,21 @@ class AbstractCRUDReservationService(CRUDBase[
         :return: The Reservation Service instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def get_detail_by_alias(
+            self, alias: str,
+            include_removed: bool = False
+    ) -> ReservationServiceModel | None:
+        """
+        Retrieves a Reservation Service instance by its alias together
+        with its calendars and mini services, loaded in one batch each.
+
+        :param alias: The alias of the Reservation Service.
+        :param include_removed: Include removed object or not.
+
+        :return: The Reservation Service instance if found, None otherwise.
+        """
+
     @abstractmethod
     async def get_by_room_id(
             self, room_id: int,
@@ -62,6 +114,18 @@ class AbstractCRUDReservationService(CRUDBase[
         :return: The Reservation Service instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def exists_by_name_or_alias(self, name: str, alias: str) -> str | None:
+        """
+        Checks in one query whether a Reservation Service, including removed ones,
+        already uses the name or the alias.
+
+        :param name: The name of the Reservation Service.
+        :param alias: The alias of the Reservation Service.
+
+        :return: "name" or "alias" by the conflicting field, None otherwise.
+        """
+
     @abstractmethod
     async def get_all_aliases(self) -> list[str]:
         """
@@ -70,16 +134,30 @@ class AbstractCRUDReservationService(CRUDBase[
         :return: list of aliases.
         """
 
+    @abstractmethod
+    async def get_all_with_children(
+            self, include_removed: bool = False
+    ) -> list[ReservationServiceModel]:
+        """
+        Retrieves all Reservation Services with their calendars and mini services,
+        one query for each of the three tables.
+
+        :param include_removed: Include removed objects or not.
+
+        :return: list of Reservation Services.
+        """
+
     @abstractmethod
     async def get_public_services(
             self, include_removed: bool = False
     ) -> list[ReservationServiceModel]:
         """
-        Retrieves a public Reservation Service instance.
+        Retrieves public Reservation Services together with their calendars
+        and mini services, loaded in one batch each.
 
         :param include_removed: Include removed object or not.
 
-        :return: The public Reservation Service instance if found, None otherwise.
+        :return: list of public Reservation Services.
         """
 
 
@@ -95,40 +173,75 @@ class CRUDReservationService(AbstractCRUDReservationService):
 
     async def get_by_name(self, name: str,
                           include_removed: bool = False) -> ReservationServiceModel | None:
-        stmt = select(self.model).filter(self.model.name == name)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
+        stmt = _SEL_BY_NAME_INCL_DELETED if include_removed else _SEL_BY_NAME
+        result = await self.db.execute(stmt, {"name": name})
         return result.scalar_one_or_none()
 
     async def get_by_alias(self, alias: str,
                            include_removed: bool = False) -> ReservationServiceModel | None:
-        stmt = select(self.model).filter(self.model.alias == alias)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
+        stmt = _SEL_BY_ALIAS_INCL_DELETED if include_removed else _SEL_BY_ALIAS
+        result = await self.db.execute(stmt, {"alias": alias})
+        return result.scalar_one_or_none()
+
+    async def get_detail_by_alias(
+            self, alias: str,
+            include_removed: bool = False
+    ) -> ReservationServiceModel | None:
+        stmt = _SEL_DETAIL_BY_ALIAS_INCL_DELETED if include_removed \
+            else _SEL_DETAIL_BY_ALIAS
+        result = await self.db.execute(stmt, {"alias": alias})
         return result.scalar_one_or_none()
 
     async def get_by_room_id(
             self, room_id: int,
             include_removed: bool = False
     ) -> ReservationServiceModel | None:
-        stmt = select(self.model).filter(self.model.room_id == room_id)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
+        stmt = _SEL_BY_ROOM_ID_INCL_DELETED if include_removed else _SEL_BY_ROOM_ID
+        result = await self.db.execute(stmt, {"room_id": room_id})
         return result.scalar_one_or_none()
 
+    async def exists_by_name_or_alias(self, name: str, alias: str) -> str | None:
+        name_exists, alias_exists = (await self.db.execute(_SEL_NAME_OR_ALIAS_EXISTS, {
+            "name": name, "alias": alias})).one()
+        if name_exists:
+            return "name"
+        if alias_exists:
+            return "alias"
+        return None
+
     async def get_all_aliases(self) -> list[str]:
         stmt = select(self.model.alias)
         result = await self.db.execute(stmt)
         return [row[0] for row in result.fetchall()]
 
+    async def get_all_with_children(
+            self, include_removed: bool = False
+    ) -> list[ReservationServiceModel]:
+        reservation_services = await self.get_all(include_removed)
+        if not reservation_services:
+            return []
+        ids = [reservation_service.id for reservation_service in reservation_services]
+
+        children: dict[type, defaultdict] = {}
+        for model in (CalendarModel, MiniServiceModel):
+            stmt = select(model).filter(model.reservation_service_id.in_(ids))
+            if include_removed:
+                stmt = stmt.execution_options(include_deleted=True)
+            by_service = defaultdict(list)
+            for child in (await self.db.scalars(stmt)).all():
+                by_service[child.reservation_service_id].append(child)
+            children[model] = by_service
+
+        # Set as loaded values, so the session doesn't see them as changes
+        for reservation_service in reservation_services:
+            set_committed_value(reservation_service, "calendars",
+                                children[CalendarModel][reservation_service.id])
+            set_committed_value(reservation_service, "mini_services",
+                                children[MiniServiceModel][reservation_service.id])
+        return reservation_services
+
     async def get_public_services(
             self, include_removed: bool = False
     ) -> list[ReservationServiceModel]:
-        stmt = select(self.model).filter(self.model.public)
-        if include_removed:
-            stmt = stmt.execution_options(include_deleted=True)
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        stmt = _SEL_PUBLIC_INCL_DELETED if include_removed else _SEL_PUBLIC
+        return list((await self.db.scalars(stmt)).all())
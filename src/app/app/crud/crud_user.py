@@ -4,11 +4,13 @@ abstract base class (AbstractCRUDUser) and a concrete implementation (CRUDUser)
 using SQLAlchemy.
 """
 from abc import ABC, abstractmethod
+from typing import Any, Collection
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from models import UserModel
-from schemas import UserCreate, UserUpdate
+from schemas import UserCreate, UserUpdate, UserSummary
 
 from crud import CRUDBase
 
@@ -34,6 +36,49 @@ class AbstractCRUDUser(CRUDBase[
         :return: The User instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def get_with_events(self, user_id: int) -> UserModel | None:
+        """
+        Retrieves a User instance by its id together with its events.
+
+        :param user_id: The id of the User.
+
+        :return: The User instance if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def exists(self, user_id: int) -> bool:
+        """
+        Checks if the User exists, without loading it.
+
+        :param user_id: The id of the User.
+
+        :return: True if the User exists, False otherwise.
+        """
+
+    @abstractmethod
+    async def get_summary(self, user_id: int) -> UserSummary | None:
+        """
+        Retrieves only id and full name of the User, without loading its events.
+
+        :param user_id: The id of the User.
+
+        :return: The User summary if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def upsert_by_username(self, values: dict[str, Any],
+                                 update_fields: Collection[str]) -> UserModel:
+        """
+        Creates a User, or updates the given fields of the User
+        with the same username, in one INSERT ... ON CONFLICT statement.
+
+        :param values: Values of all columns of the created User.
+        :param update_fields: Fields updated when the User already exists.
+
+        :return: The created or updated User instance.
+        """
+
 
 class CRUDUser(AbstractCRUDUser):
     """
@@ -45,7 +90,42 @@ class CRUDUser(AbstractCRUDUser):
     def __init__(self, db: AsyncSession):
         super().__init__(UserModel, db)
 
+    async def get_all(self, include_removed: bool = False) -> list[UserModel]:
+        stmt = self.model.with_events_loaded().execution_options(
+            include_deleted=include_removed)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_username(self, username: str) -> UserModel | None:
         stmt = select(self.model).filter(self.model.username == username)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_with_events(self, user_id: int) -> UserModel | None:
+        stmt = self.model.with_events_loaded().filter(self.model.id == user_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def exists(self, user_id: int) -> bool:
+        stmt = select(self.model.id).filter(self.model.id == user_id).limit(1)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def get_summary(self, user_id: int) -> UserSummary | None:
+        stmt = select(self.model.id, self.model.full_name).filter(self.model.id == user_id)
+        row = (await self.db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return UserSummary.model_construct(id=row.id, full_name=row.full_name)
+
+    async def upsert_by_username(self, values: dict[str, Any],
+                                 update_fields: Collection[str]) -> UserModel:
+        stmt = insert(self.model).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.username],
+            set_={field: stmt.excluded[field] for field in update_fields}
+        ).returning(self.model)
+        user = (await self.db.scalars(
+            stmt, execution_options={"populate_existing": True})).one()
+        await self.db.commit()
+        return user
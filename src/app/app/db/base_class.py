@@ -1,9 +1,10 @@
 """
 Module with SQLAlchemy base class used to create other models from this Base class.
 """
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy.orm import declared_attr, DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as pgUUID
 
 
@@ -18,11 +19,12 @@ class Base(DeclarativeBase):
 
     id: Mapped[UUID] =  mapped_column(pgUUID(as_uuid=True), primary_key=True, default=uuid4)
 
-    # declared_attr decorator already treats method as a class method and requires to use cls
-    # pylint: disable=no-self-argument
-    # Generate __tablename__ automatically
-    @declared_attr  # type: ignore
-    def __tablename__(cls) -> str:
-        return cls.__name__.lower()
-    # pylint: enable=no-self-argument
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Generate __tablename__ once as a plain class attribute,
+        # unless the model declares its own
+        if "__tablename__" not in cls.__dict__:
+            cls.__tablename__ = cls.__name__.lower()
+        super().__init_subclass__(**kwargs)
+
+
 # pyling: enable=too-few-public-methods
@@ -3,6 +3,8 @@ Module which includes classes and methods responsible for connection to database
 """
 from typing import AsyncGenerator
 from asyncio import current_task
+import orjson
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, \
     async_scoped_session, AsyncSession
 from core import settings
@@ -24,7 +26,21 @@ class DatabaseSession:
     def __init__(self):
         self.engine = create_async_engine(
             url=str(settings.POSTGRES_DATABASE_URI),
-            pool_pre_ping=True
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.POSTGRES_POOL_SIZE,
+            max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+            pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+            # Drop connections before the server or a proxy closes them
+            pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+            pool_pre_ping=True,
+            json_serializer=lambda obj: orjson.dumps(obj).decode(),
+            json_deserializer=orjson.loads,
+            connect_args={
+                # SQLAlchemy side cache of asyncpg prepared statements
+                "prepared_statement_cache_size": 500,
+                # asyncpg side cache of server-side prepared statements
+                "statement_cache_size": 500,
+            }
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
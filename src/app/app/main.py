@@ -5,12 +5,15 @@ In other words it is an entry point of the application.
 from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from api import users, events, calendars, mini_services, reservation_services, \
     fastapi_docs, emails, BaseAppException, app_exception_handler, access_card_system
 from core import settings
+from services.email_services import shutdown_pdf_executor
 # import os
 # os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1' # for local testing
 
@@ -26,6 +29,7 @@ async def startup_event(fast_api_app: FastAPI):
     print(f"Starting {settings.APP_NAME}.")
     yield
     print(f"Shutting down {settings.APP_NAME}.")
+    shutdown_pdf_executor()
 
 
 # pylint: enable=unused-argument
@@ -36,7 +40,8 @@ app: FastAPI = FastAPI(
     description=fastapi_docs.DESCRIPTION,
     version=fastapi_docs.VERSION,
     openapi_tags=fastapi_docs.get_tags_metadata(),
-    lifespan=startup_event
+    lifespan=startup_event,
+    default_response_class=ORJSONResponse
 )
 app.include_router(users.router)
 app.include_router(events.router)
@@ -53,6 +58,11 @@ app.add_middleware(
     secret_key=settings.SECRET_KEY,
 )
 
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["https://develop.reservation.buk.cvut.cz", "https://reservation.buk.cvut.cz",
@@ -68,6 +78,9 @@ if __name__ == "__main__":
                 port=settings.APP_SERVER_PORT,
                 reload=settings.APP_SERVER_USE_RELOAD,
                 proxy_headers=settings.APP_SERVER_USE_PROXY_HEADERS,
+                # uvloop and httptools are used when installed, uvloop has no Windows build
+                loop="auto",
+                http="auto",
                 # ssl_keyfile="certification/key.pem",  # for local testing
                 # ssl_certfile="certification/cert.pem"
                 )
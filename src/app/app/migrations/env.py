@@ -23,6 +23,7 @@ load_dotenv(dotenv_path=".env.secret")
 # pylint: disable=wildcard-import
 from models import *
 # pylint: enable=wildcard-import
+from models import RulesType, RolesType
 from db import Base
 from core import settings
 
@@ -53,7 +54,10 @@ def render_item(type_, obj, autogen_context):  # pylint: disable=unused-argument
     """Custom render function to support user-defined types like RulesType."""
     if isinstance(obj, RulesType):
         autogen_context.imports.add("from models import RulesType")
-        return "RulesType(length=sa.TEXT())"
+        return "RulesType()"
+    if isinstance(obj, RolesType):
+        autogen_context.imports.add("from models import RolesType")
+        return "RolesType()"
     return False
 
 
@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from models import RulesType
 from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
@@ -51,9 +50,9 @@ def upgrade() -> None:
     sa.Column('more_than_max_people_with_permission', sa.Boolean(), nullable=False),
     sa.Column('collision_with_itself', sa.Boolean(), nullable=False),
     sa.Column('collision_with_calendar', postgresql.ARRAY(sa.String()), nullable=True),
-    sa.Column('club_member_rules', RulesType(length=sa.TEXT()), nullable=True),
-    sa.Column('active_member_rules', RulesType(length=sa.TEXT()), nullable=False),
-    sa.Column('manager_rules', RulesType(length=sa.TEXT()), nullable=False),
+    sa.Column('club_member_rules', sa.TEXT(), nullable=True),
+    sa.Column('active_member_rules', sa.TEXT(), nullable=False),
+    sa.Column('manager_rules', sa.TEXT(), nullable=False),
     sa.Column('reservation_service_id', sa.UUID(), nullable=False),
     sa.Column('mini_services', postgresql.ARRAY(sa.String()), nullable=True),
     sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
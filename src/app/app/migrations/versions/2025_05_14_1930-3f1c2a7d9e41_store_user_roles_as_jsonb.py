@@ -0,0 +1,47 @@
+"""Store user roles as JSONB
+
+Revision ID: 3f1c2a7d9e41
+Revises: ea3c9c7b12fe
+Create Date: 2025-05-14 19:30:12.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a7d9e41'
+down_revision: Union[str, None] = 'ea3c9c7b12fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('user', 'roles',
+                    existing_type=postgresql.ARRAY(sa.String()),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    server_default=sa.text("'[]'::jsonb"),
+                    postgresql_using="COALESCE(to_jsonb(roles), '[]'::jsonb)")
+    op.create_index('ix_user_roles', 'user', ['roles'], unique=False,
+                    postgresql_using='gin',
+                    postgresql_ops={'roles': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_roles', table_name='user',
+                  postgresql_using='gin',
+                  postgresql_ops={'roles': 'jsonb_path_ops'})
+    op.alter_column('user', 'roles',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    server_default=None)
+    # Subqueries are not allowed in USING, JSON array text is rewritten to array literal
+    op.alter_column('user', 'roles',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=postgresql.ARRAY(sa.String()),
+                    existing_nullable=True,
+                    postgresql_using="translate(roles::text, '[]', '{}')::varchar[]")
@@ -0,0 +1,57 @@
+"""Pack calendar rules into bigint
+
+Revision ID: e7a4d2b91c05
+Revises: c5e91f3a7b20
+Create Date: 2025-05-17 16:45:03.118240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a4d2b91c05'
+down_revision: Union[str, None] = 'c5e91f3a7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RULES_COLUMNS = ('club_member_rules', 'active_member_rules', 'manager_rules')
+
+
+def _pack(column: str) -> str:
+    # Same bit layout as schemas.calendar.pack_rules
+    rules = f"({column}::jsonb)"
+    return (f"((({rules}->>'night_time')::boolean)::int::bigint"
+            f" | ((({rules}->>'reservation_without_permission')::boolean)::int::bigint << 1)"
+            f" | (({rules}->>'max_reservation_hours')::bigint << 2)"
+            f" | (({rules}->>'in_advance_hours')::bigint << 17)"
+            f" | (({rules}->>'in_advance_minutes')::bigint << 32)"
+            f" | (({rules}->>'in_prior_days')::bigint << 47))")
+
+
+def _unpack(column: str) -> str:
+    return (f"json_build_object("
+            f"'night_time', ({column} & 1) = 1, "
+            f"'reservation_without_permission', ({column} >> 1 & 1) = 1, "
+            f"'max_reservation_hours', {column} >> 2 & 32767, "
+            f"'in_advance_hours', {column} >> 17 & 32767, "
+            f"'in_advance_minutes', {column} >> 32 & 32767, "
+            f"'in_prior_days', {column} >> 47 & 65535)::text")
+
+
+def upgrade() -> None:
+    for column in RULES_COLUMNS:
+        op.alter_column('calendar', column,
+                        existing_type=sa.TEXT(),
+                        type_=sa.BigInteger(),
+                        postgresql_using=_pack(column))
+
+
+def downgrade() -> None:
+    for column in RULES_COLUMNS:
+        op.alter_column('calendar', column,
+                        existing_type=sa.BigInteger(),
+                        type_=sa.TEXT(),
+                        postgresql_using=_unpack(column))
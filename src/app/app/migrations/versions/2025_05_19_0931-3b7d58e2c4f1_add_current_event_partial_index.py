@@ -0,0 +1,34 @@
+"""Add partial index of current events
+
+Revision ID: 3b7d58e2c4f1
+Revises: a9f3c61d4e08
+Create Date: 2025-05-19 09:31:42.118903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d58e2c4f1'
+down_revision: Union[str, None] = 'a9f3c61d4e08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently, so the event table stays writable meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index('ix_event_current', 'event',
+                        ['user_id', 'start_datetime', 'end_datetime'], unique=False,
+                        postgresql_where=sa.text("event_state <> 'CANCELED'"),
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_event_current', table_name='event',
+                      postgresql_where=sa.text("event_state <> 'CANCELED'"),
+                      postgresql_concurrently=True)
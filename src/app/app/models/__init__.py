@@ -1,7 +1,7 @@
 """
 Package for ORM models.
 """
-from .user import User as UserModel
+from .user import User as UserModel, RolesType
 from .calendar import Calendar as CalendarModel, RulesType
 from .event import Event as EventModel, EventState
 from .mini_service import MiniService as MiniServiceModel
@@ -9,7 +9,7 @@ from .reservation_service import ReservationService as ReservationServiceModel
 from .soft_delete_mixin import SoftDeleteMixin
 
 __all__ = [
-    "UserModel",
+    "UserModel", "RolesType",
     "CalendarModel",
     "EventModel", "EventState",
     "MiniServiceModel",
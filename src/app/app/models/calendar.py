@@ -2,13 +2,12 @@
 Calendar ORM model and its dependencies.
 """
 from typing import Type, Any, TYPE_CHECKING
-import json
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import mapped_column, relationship, Mapped
-from sqlalchemy.types import TypeDecorator, TEXT
+from sqlalchemy.types import TypeDecorator, BigInteger
 from db.base_class import Base
-from schemas.calendar import Rules
+from schemas.calendar import Rules, pack_rules, unpack_rules
 from models.soft_delete_mixin import SoftDeleteMixin
 
 
@@ -16,42 +15,44 @@ if TYPE_CHECKING:
     from models.reservation_service import ReservationService
     from models.event import Event
 
+
 # pylint: disable=too-many-ancestors
 class RulesType(TypeDecorator):
     """
     Custom SQLAlchemy type to handle the serialization and deserialization of
-    the `Rules` Pydantic model to and from JSON.
+    the `Rules` Pydantic model to and from integer with packed fields.
     """
-    impl = TEXT
+    impl = BigInteger
+    cache_ok = True
 
     @property
     def python_type(self) -> Type[Any]:
         return Rules
 
     def load_dialect_impl(self, dialect):
-        return dialect.type_descriptor(TEXT())
+        return dialect.type_descriptor(BigInteger())
 
     def process_bind_param(self, value, dialect):
         if value is None:
             return None
         if isinstance(value, dict):
             value = Rules(**value)
-        return json.dumps(value.model_dump())
+        return pack_rules(value)
 
     def process_result_value(self, value, dialect):
         if value is None:
             return None
-        return Rules.model_validate_json(value)
+        return unpack_rules(value)
 
     def process_literal_param(self, value, dialect):
         if value is None:
             return None
         if isinstance(value, dict):
             value = Rules(**value)
-        return json.dumps(value.model_dump())
+        return str(pack_rules(value))
 
     def copy(self, **kw):
-        return RulesType(self.impl)
+        return RulesType()
 
 
 # pylint: disable=too-few-public-methods
@@ -63,6 +64,12 @@ class Calendar(Base, SoftDeleteMixin):
     Calendar model to create and manipulate user entity in the database.
     """
 
+    __table_args__ = (
+        # Containment lookups of the calendars colliding with a given one
+        Index("ix_calendar_collision_with_calendar", "collision_with_calendar",
+              postgresql_using="gin"),
+    )
+
     id: Mapped[str] = mapped_column(primary_key=True)
     reservation_type: Mapped[str] = mapped_column(unique=True, nullable=False)
     color: Mapped[str] = mapped_column(default="#05baf5", nullable=False)
@@ -4,7 +4,7 @@ Event ORM model and its dependencies.
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
-from sqlalchemy import ForeignKey, String, Enum as SQLAlchemyEnum, text
+from sqlalchemy import ForeignKey, Index, String, Enum as SQLAlchemyEnum, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from db.base_class import Base
@@ -63,4 +63,12 @@ class Event(Base, SoftDeleteMixin):
         back_populates="events")
     additional_services: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=True)
 
+    __table_args__ = (
+        # Keyset pagination of user events ordered by (start_datetime, id)
+        Index("ix_event_user_id_start_datetime_id", "user_id", "start_datetime", "id"),
+        # Lookup of the current reservation of the user by the access card system
+        Index("ix_event_current", "user_id", "start_datetime", "end_datetime",
+              postgresql_where=text("event_state <> 'CANCELED'")),
+    )
+
 # pylint: enable=too-few-public-methods
@@ -2,7 +2,7 @@
 Mini service ORM model and its dependencies.
 """
 from typing import TYPE_CHECKING
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -24,6 +24,9 @@ class MiniService(Base, SoftDeleteMixin):
     __tablename__ = "mini_service"
     __table_args__ = (
         UniqueConstraint("access_group", name="uq_mini_service_access_group"),
+        # Access card lookups by room, only live rows are ever matched
+        Index("ix_mini_service_room_id_live", "room_id",
+              postgresql_where=text("deleted_at IS NULL")),
     )
 
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
@@ -2,7 +2,7 @@
 Reservation service ORM model and its dependencies.
 """
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer
+from sqlalchemy import Index, Integer, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from db.base_class import Base
@@ -22,6 +22,11 @@ class ReservationService(Base, SoftDeleteMixin):
     Reservation service model to create and manipulate reservation service entity in the database.
     """
     __tablename__ = "reservation_service"
+    __table_args__ = (
+        # Access card lookups by room, only live rows are ever matched
+        Index("ix_reservation_service_room_id_live", "room_id",
+              postgresql_where=text("deleted_at IS NULL")),
+    )
 
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
     alias: Mapped[str] = mapped_column(unique=True, nullable=False)
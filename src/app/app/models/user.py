@@ -1,10 +1,11 @@
 """
 User ORM model and its dependencies.
 """
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String
-from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import Optional, Type, Any, TYPE_CHECKING
+from sqlalchemy import Index, Select, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload, raiseload
+from sqlalchemy.types import TypeDecorator
 from db.base_class import Base
 from models.soft_delete_mixin import SoftDeleteMixin
 
@@ -12,6 +13,33 @@ if TYPE_CHECKING:
     from models.event import Event
 
 
+# pylint: disable=too-many-ancestors
+class RolesType(TypeDecorator):
+    """
+    Custom SQLAlchemy type storing user roles as a JSONB array.
+    Roles are loaded as a frozenset, so membership checks are O(1).
+    """
+    impl = JSONB
+    cache_ok = True
+
+    @property
+    def python_type(self) -> Type[Any]:
+        return frozenset
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return sorted(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return frozenset()
+        return frozenset(value)
+
+    def copy(self, **kw):
+        return RolesType()
+
+
 # pylint: disable=too-few-public-methods
 # reason: ORM model does not require to have any public methods
 class User(Base, SoftDeleteMixin):
@@ -25,9 +53,25 @@ class User(Base, SoftDeleteMixin):
     room_number: Mapped[str] = mapped_column(nullable=False)
     active_member: Mapped[bool] = mapped_column(unique=False, nullable=False, default=False)
     section_head: Mapped[bool] = mapped_column(unique=False, nullable=False, default=False)
-    roles: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String), unique=False, nullable=True)
+    roles: Mapped[Optional[frozenset[str]]] = mapped_column(
+        RolesType(), unique=False, nullable=True, server_default="[]")
 
+    # Events are loaded only where requested, see with_events_loaded
     events: Mapped[list["Event"]] = relationship(
-        back_populates="user", lazy="selectin")
+        back_populates="user", lazy="raise")
+
+    __table_args__ = (
+        Index("ix_user_roles", "roles", postgresql_using="gin",
+              postgresql_ops={"roles": "jsonb_path_ops"}),
+    )
+
+    @classmethod
+    def with_events_loaded(cls) -> Select:
+        """
+        Select users with their events loaded in one batched query.
+        Any other relationship raises on access instead of being
+        lazy loaded during serialization.
+        """
+        return select(cls).options(selectinload(cls.events), raiseload("*"))
 
 # pylint: enable=too-few-public-methods
@@ -1,11 +1,11 @@
 """
 Shortcuts to easily import schemes.
 """
-from .user import User, UserCreate, UserUpdate, UserInDB
+from .user import User, UserCreate, UserUpdate, UserInDB, UserSummary
 from .event import EventCreate, EventCreateToDb, EventUpdate, Event, EventInDB, EventUpdateTime, \
-    EventWithExtraDetails
+    EventWithExtraDetails, EventsPage
 from .data_is import UserIS, RoleList, Role, ServiceList, ServiceValidity, \
-    InformationFromIS, LimitObject, Service, Zone, Room
+    InformationFromIS, LimitObject, Service, Zone, Room, ROLES_ADAPTER, SERVICES_ADAPTER
 from .calendar import Calendar, CalendarCreate, CalendarUpdate, CalendarInDBBase, Rules
 from .mini_service import MiniService, MiniServiceCreate, MiniServiceUpdate, MiniServiceInDBBase
 from .reservation_service import ReservationService, ReservationServiceCreate, \
@@ -14,15 +14,15 @@ from .email import EmailCreate, RegistrationFormCreate, EmailMeta
 from .access_card_system import VarSymbolCreateUpdate, VarSymbolDelete, ClubAccessSystemRequest
 
 __all__ = [
-    "User", "UserCreate", "UserUpdate", "UserInDB",
+    "User", "UserCreate", "UserUpdate", "UserInDB", "UserSummary",
     "Calendar", "CalendarCreate", "CalendarUpdate", "CalendarInDBBase", "Rules",
     "MiniService", "MiniServiceCreate", "MiniServiceUpdate", "MiniServiceInDBBase",
     "ReservationService", "ReservationServiceCreate", "ReservationServiceUpdate",
     "ReservationServiceInDBBase",
     "EventCreate", "EventCreateToDb", "EventUpdate", "Event", "EventInDB", "EventUpdateTime",
-    "EventWithExtraDetails",
+    "EventWithExtraDetails", "EventsPage",
     "EmailCreate", "RegistrationFormCreate",
     "UserIS", "RoleList", "Role", "ServiceList", "ServiceValidity", "InformationFromIS",
-    "Zone", "Room", "LimitObject", "Service", "EmailMeta",
+    "Zone", "Room", "LimitObject", "Service", "EmailMeta", "ROLES_ADAPTER", "SERVICES_ADAPTER",
     "VarSymbolCreateUpdate", "VarSymbolDelete", "ClubAccessSystemRequest",
 ]
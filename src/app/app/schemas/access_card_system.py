@@ -1,7 +1,7 @@
 """
 DTO schemes for Access Card System entity.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class VarSymbolCreateUpdate(BaseModel):
@@ -17,6 +17,8 @@ class VarSymbolDelete(BaseModel):
     var_symbol: int
     group: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ClubAccessSystemRequest(BaseModel):
     """
@@ -25,3 +27,5 @@ class ClubAccessSystemRequest(BaseModel):
     uid: int
     room_id: int
     device_id: int
+
+    model_config = ConfigDict(frozen=True)
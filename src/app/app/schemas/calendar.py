@@ -1,19 +1,104 @@
 """DTO schemes for Calendar entity."""
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Any, Mapping, Optional, List, Self
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
+from schemas.utils import OrmFastConstructMixin, InternedStr
+
+
+# Bit layout of the rules packed into one BIGINT, (offset, width) of the fields
+_NIGHT_TIME_BIT = 0
+_WITHOUT_PERMISSION_BIT = 1
+_MAX_RESERVATION_HOURS = (2, 15)
+_IN_ADVANCE_HOURS = (17, 15)
+_IN_ADVANCE_MINUTES = (32, 15)
+_IN_PRIOR_DAYS = (47, 16)
 
 
 class Rules(BaseModel):
     """Represents rules of user."""
     night_time: bool
     reservation_without_permission: bool
-    max_reservation_hours: int = Field(ge=0)
-    in_advance_hours: int = Field(ge=0)
-    in_advance_minutes: int = Field(ge=0)
+    max_reservation_hours: int = Field(ge=0, lt=1 << _MAX_RESERVATION_HOURS[1])
+    in_advance_hours: int = Field(ge=0, lt=1 << _IN_ADVANCE_HOURS[1])
+    in_advance_minutes: int = Field(ge=0, lt=1 << _IN_ADVANCE_MINUTES[1])
     # How many prior days can a person reserve for
-    in_prior_days: int = Field(ge=0)
+    in_prior_days: int = Field(ge=0, lt=1 << _IN_PRIOR_DAYS[1])
+
+    model_config = ConfigDict(frozen=True)
+
+    # Deltas used by every reservation check, derived from the fields once
+    _max_duration_delta: timedelta = PrivateAttr()
+    _advance_delta: timedelta = PrivateAttr()
+    _prior_delta: timedelta = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._max_duration_delta = timedelta(hours=self.max_reservation_hours)
+        self._advance_delta = timedelta(hours=self.in_advance_hours,
+                                        minutes=self.in_advance_minutes)
+        self._prior_delta = timedelta(days=self.in_prior_days)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None,
+                   deep: bool = False) -> Self:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # The copy gets the deltas of the original, derive them from the new fields
+            copy.model_post_init(None)
+        return copy
+
+    @property
+    def max_duration_delta(self) -> timedelta:
+        """Longest allowed reservation."""
+        return self._max_duration_delta
+
+    @property
+    def advance_delta(self) -> timedelta:
+        """How long before its start the reservation must be made at least."""
+        return self._advance_delta
+
+    @property
+    def prior_delta(self) -> timedelta:
+        """How long before its start the reservation can be made at most."""
+        return self._prior_delta
+
+def pack_rules(rules: Rules) -> int:
+    """
+    Pack rules into one integer stored in the calendar row.
+
+    :param rules: Rules to pack.
+
+    :return: Packed rules, fits into signed 64-bit integer.
+    """
+    return (rules.night_time << _NIGHT_TIME_BIT
+            | rules.reservation_without_permission << _WITHOUT_PERMISSION_BIT
+            | rules.max_reservation_hours << _MAX_RESERVATION_HOURS[0]
+            | rules.in_advance_hours << _IN_ADVANCE_HOURS[0]
+            | rules.in_advance_minutes << _IN_ADVANCE_MINUTES[0]
+            | rules.in_prior_days << _IN_PRIOR_DAYS[0])
+
+
+def _field(packed: int, layout: tuple[int, int]) -> int:
+    offset, width = layout
+    return (packed >> offset) & ((1 << width) - 1)
+
+
+def unpack_rules(packed: int) -> Rules:
+    """
+    Unpack rules from the integer stored in the calendar row.
+    The rules were validated before packing, so they are not validated again.
+
+    :param packed: Packed rules.
+
+    :return: Rules.
+    """
+    return Rules.model_construct(
+        night_time=bool(packed >> _NIGHT_TIME_BIT & 1),
+        reservation_without_permission=bool(packed >> _WITHOUT_PERMISSION_BIT & 1),
+        max_reservation_hours=_field(packed, _MAX_RESERVATION_HOURS),
+        in_advance_hours=_field(packed, _IN_ADVANCE_HOURS),
+        in_advance_minutes=_field(packed, _IN_ADVANCE_MINUTES),
+        in_prior_days=_field(packed, _IN_PRIOR_DAYS),
+    )
 
 
 class CalendarBase(BaseModel):
@@ -28,7 +113,7 @@ class CalendarBase(BaseModel):
 class CalendarCreate(CalendarBase):
     """Properties to receive via API on creation."""
     reservation_service_id: UUID
-    reservation_type: str
+    reservation_type: InternedStr
     max_people: int = Field(ge=1)
     collision_with_itself: bool
     club_member_rules: Rules
@@ -38,7 +123,7 @@ class CalendarCreate(CalendarBase):
 
 class CalendarUpdate(CalendarBase):
     """Properties to receive via API on update."""
-    reservation_type: str | None = None
+    reservation_type: InternedStr | None = None
     max_people: int | None = Field(None, ge=1)
     collision_with_itself: bool | None = None
     collision_with_calendar: List[str] = Field(default_factory=list)
@@ -48,11 +133,11 @@ class CalendarUpdate(CalendarBase):
     mini_services: List[str] = Field(default_factory=list)
 
 
-class CalendarInDBBase(CalendarBase):
+class CalendarInDBBase(OrmFastConstructMixin, CalendarBase):
     """Base model for calendar in database."""
     id: str
     deleted_at: Optional[datetime] = None
-    reservation_type: str
+    reservation_type: InternedStr
     max_people: int
     collision_with_itself: bool
     club_member_rules: Rules
@@ -60,11 +145,7 @@ class CalendarInDBBase(CalendarBase):
     manager_rules: Rules
     reservation_service_id: UUID
 
-    # pylint: disable=too-few-public-methods
-    # reason: Config class only needs to set orm_mode to True.
-    class Config:
-        """Config class for database calendar model."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Calendar(CalendarInDBBase):
@@ -2,7 +2,8 @@
 DTO schemes for Data from IS.
 """
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from schemas.utils import InternedStr
 
 
 class Organization(BaseModel):
@@ -25,12 +26,12 @@ class UserIS(BaseModel):
     phone_vpn: Optional[str]
     photo_file: Optional[str]
     photo_file_small: Optional[str]
-    state: str
+    state: InternedStr
     surname: str
     ui_language: Optional[str]
     ui_skin: str
     username: str
-    usertype: str
+    usertype: InternedStr
 
 
 class Service(BaseModel):
@@ -38,7 +39,7 @@ class Service(BaseModel):
     alias: str
     name: str
     note: Optional[str]
-    servicetype: str
+    servicetype: InternedStr
     web: str
 
 
@@ -48,7 +49,7 @@ class ServiceValidity(BaseModel):
     to: Optional[str]
     note: Optional[str]
     service: Service
-    usetype: str
+    usetype: InternedStr
 
 
 class ServiceList(BaseModel):
@@ -67,7 +68,7 @@ class LimitObject(BaseModel):
 
 class Role(BaseModel):
     """Represents a role."""
-    role: str
+    role: InternedStr
     name: str
     description: str
     limit: str
@@ -101,3 +102,9 @@ class InformationFromIS(BaseModel):
     user: UserIS
     room: Room
     services: list[ServiceValidity]
+
+
+# The IS returns roles and services as bare JSON arrays,
+# the adapters validate the raw response body straight into the schemas
+ROLES_ADAPTER: TypeAdapter[list[Role]] = TypeAdapter(list[Role])
+SERVICES_ADAPTER: TypeAdapter[list[ServiceValidity]] = TypeAdapter(list[ServiceValidity])
@@ -3,7 +3,7 @@ DTO schemes for Email entity.
 """
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class EmailCreate(BaseModel):
@@ -11,7 +11,9 @@ class EmailCreate(BaseModel):
     email: List[EmailStr]
     subject: str
     body: str
-    attachment: Optional[str] = None
+    # Content of the attachment, kept in memory rather than in a shared file
+    attachment: Optional[bytes] = None
+    attachment_name: Optional[str] = None
 
 
 class EmailMeta(BaseModel):
@@ -20,6 +22,8 @@ class EmailMeta(BaseModel):
     subject: str
     reason: str
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class RegistrationFormCreate(BaseModel):
     """Schema for creating a registration form."""
@@ -2,46 +2,38 @@
 DTO schemes for Event entity.
 """
 from datetime import datetime
-from typing import List, Any
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from typing import List, Any, Annotated
+from pydantic import BaseModel, Field, EmailStr, BeforeValidator, ConfigDict
 from models.event import EventState
+from schemas.utils import OrmFastConstructMixin, InternedStr, InternalEmail
 
 
-# pylint: disable=too-few-public-methods
-# reason: This class need for proper validation
-class NaiveDatetimeValidatorMixin:
+def _check_naive_datetime(value: Any) -> Any:
     """
-    Mixin to validate that datetime fields are naive (i.e., without timezone info).
+    Validates that datetime values are naive (not timezone-aware).
+
+    :param value: Input value (string or datetime)
+    :return: Validated value if naive
+    :raises ValueError: If datetime is timezone-aware or invalid format
     """
+    if value.__class__ is str:
+        try:
+            # Python 3.11 fromisoformat parses the trailing "Z" itself
+            value = datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise ValueError("Invalid datetime format") from exc
+    elif value is None:
+        return value
+    elif not isinstance(value, datetime):
+        raise ValueError("Invalid datetime value")
 
-    @field_validator("start_datetime", "end_datetime", mode="before")
-    def check_naive_datetime(cls, value: Any) -> Any:  # pylint: disable=no-self-argument
-        """
-        Validates that datetime values are naive (not timezone-aware).
-
-        :param value: Input value (string or datetime)
-        :return: Validated value if naive
-        :raises ValueError: If datetime is timezone-aware or invalid format
-        """
-        if value is None:
-            return value
-
-        if isinstance(value, str):
-            try:
-                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            except ValueError as exc:
-                raise ValueError("Invalid datetime format") from exc
-
-            if parsed.tzinfo is not None:
-                raise ValueError("Datetime must be naive (no timezone info)")
-            return value
-
-        if isinstance(value, datetime):
-            if value.tzinfo is not None:
-                raise ValueError("Datetime must be naive (no timezone info)")
-            return value
+    if value.tzinfo is not None:
+        raise ValueError("Datetime must be naive (no timezone info)")
+    return value
 
-        raise ValueError("Invalid datetime value")
+
+# Datetime accepted only without timezone info
+NaiveDatetime = Annotated[datetime, BeforeValidator(_check_naive_datetime)]
 
 
 class EventBase(BaseModel):
@@ -49,13 +41,13 @@ class EventBase(BaseModel):
     additional_services: List[str] = Field(default_factory=list)
 
 
-class EventCreate(NaiveDatetimeValidatorMixin, BaseModel):
+class EventCreate(BaseModel):
     """Schema for creating an event from the reservation form."""
-    start_datetime: datetime
-    end_datetime: datetime
+    start_datetime: NaiveDatetime
+    end_datetime: NaiveDatetime
     purpose: str = Field(max_length=40)
     guests: int = Field(ge=1)
-    reservation_type: str
+    reservation_type: InternedStr
     email: EmailStr
     additional_services: List[str] = Field(default_factory=list)
 
@@ -67,7 +59,7 @@ class EventCreateToDb(EventBase):
     end_datetime: datetime
     purpose: str = Field(max_length=40)
     guests: int = Field(ge=1)
-    email: EmailStr
+    email: InternalEmail
     event_state: EventState
 
     user_id: int
@@ -87,18 +79,18 @@ class EventUpdate(EventBase):
     calendar_id: str | None = None
 
 
-class EventUpdateTime(NaiveDatetimeValidatorMixin, BaseModel):
+class EventUpdateTime(BaseModel):
     """Properties to receive via API on update reservation time."""
-    start_datetime: datetime | None = None
-    end_datetime: datetime | None = None
+    start_datetime: NaiveDatetime | None = None
+    end_datetime: NaiveDatetime | None = None
 
 
-class EventInDBBase(EventBase):
+class EventInDBBase(OrmFastConstructMixin, EventBase):
     """Base model for event in database."""
     id: str
     purpose: str
     guests: int
-    email: EmailStr
+    email: InternalEmail
     start_datetime: datetime
     end_datetime: datetime
     event_state: EventState
@@ -106,11 +98,7 @@ class EventInDBBase(EventBase):
     user_id: int
     calendar_id: str
 
-    # pylint: disable=too-few-public-methods
-    # reason: Config class only needs to set orm_mode to True.
-    class Config:
-        """Config class for database event model."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Event(EventInDBBase):
@@ -121,9 +109,15 @@ class EventInDB(EventInDBBase):
     """Additional properties stored in DB"""
 
 
+class EventsPage(BaseModel):
+    """Page of events with cursor of the next page."""
+    items: List[Event]
+    next_cursor: str | None = None
+
+
 class EventWithExtraDetails(BaseModel):
     """Extend properties of event to return via API."""
     event: Event
-    reservation_type: str | None = None
+    reservation_type: InternedStr | None = None
     user_name: str | None = None
     reservation_service_name: str | None = None
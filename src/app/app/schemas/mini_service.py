@@ -2,7 +2,8 @@
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
+from schemas.utils import OrmFastConstructMixin
 
 
 class MiniServiceBase(BaseModel):
@@ -22,18 +23,14 @@ class MiniServiceUpdate(MiniServiceBase):
     name: str | None = None
 
 
-class MiniServiceInDBBase(MiniServiceBase):
+class MiniServiceInDBBase(OrmFastConstructMixin, MiniServiceBase):
     """Base model for mini service in database."""
     id: UUID
     deleted_at: Optional[datetime] = None
     name: str
     reservation_service_id: UUID
 
-    # pylint: disable=too-few-public-methods
-    # reason: Config class only needs to set orm_mode to True.
-    class Config:
-        """Config class for database mini service model."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MiniService(MiniServiceInDBBase):
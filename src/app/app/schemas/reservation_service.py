@@ -1,9 +1,10 @@
 """DTO schemes for ReservationService entity."""
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, ClassVar, Any
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from schemas import MiniService, Calendar
+from schemas.utils import OrmFastConstructMixin
 
 
 class ReservationServiceBase(BaseModel):
@@ -28,7 +29,7 @@ class ReservationServiceUpdate(ReservationServiceBase):
     alias: str | None = Field(None, max_length=6)
 
 
-class ReservationServiceInDBBase(ReservationServiceBase):
+class ReservationServiceInDBBase(OrmFastConstructMixin, ReservationServiceBase):
     """Base model for reservation service in database."""
     id: UUID
     deleted_at: Optional[datetime] = None
@@ -37,11 +38,12 @@ class ReservationServiceInDBBase(ReservationServiceBase):
     calendars: list[Calendar] = Field(default_factory=list)
     mini_services: list[MiniService] = Field(default_factory=list)
 
-    # pylint: disable=too-few-public-methods
-    # reason: Config class only needs to set orm_mode to True.
-    class Config:
-        """Config class for database mini service model."""
-        from_attributes = True
+    NESTED_FIELDS: ClassVar[dict[str, Any]] = {
+        "calendars": Calendar,
+        "mini_services": MiniService,
+    }
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReservationService(ReservationServiceInDBBase):
@@ -2,9 +2,10 @@
 DTO schemes for User entity.
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Optional, ClassVar, Any
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from schemas.event import Event
+from schemas.utils import OrmFastConstructMixin
 
 
 class UserBase(BaseModel):
@@ -31,7 +32,13 @@ class UserUpdate(UserBase):
     section_head: bool | None = None
 
 
-class UserInDBBase(UserBase):
+class UserSummary(BaseModel):
+    """Properties of user shown next to the other entities."""
+    id: int
+    full_name: str
+
+
+class UserInDBBase(OrmFastConstructMixin, UserBase):
     """Base model for user in database."""
     id: int
     deleted_at: Optional[datetime] = None
@@ -40,14 +47,21 @@ class UserInDBBase(UserBase):
     room_number: str
     active_member: bool
     section_head: bool
+    # Set of roles, so the permission checks are hashed lookups
+    roles: frozenset[str] | None = None
 
     events: list[Event] = Field(default_factory=list)
 
-    # pylint: disable=too-few-public-methods
-    # reason: Config class only needs to set orm_mode to True.
-    class Config:
-        """Config class for database user model."""
-        from_attributes = True
+    NESTED_FIELDS: ClassVar[dict[str, Any]] = {"events": Event}
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_serializer("roles")
+    def serialize_roles(self, roles: frozenset[str] | None) -> list[str] | None:
+        """Roles are loaded as a frozenset, return them as a sorted list."""
+        if roles is None:
+            return None
+        return sorted(roles)
 
 
 class User(UserInDBBase):
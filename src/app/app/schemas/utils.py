@@ -0,0 +1,56 @@
+"""
+Utils for schemas.
+"""
+import sys
+from typing import Annotated, Any, ClassVar
+from pydantic import AfterValidator, StringConstraints
+
+
+# String with small set of values repeated across many objects.
+# Interned, so the equal values share one object and compare by identity first.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Email which was already validated as EmailStr on its way in.
+# Only shape of the address is checked, by the regex of pydantic-core.
+InternalEmail = Annotated[str, StringConstraints(pattern=r"^[^\s@]+@[^\s@]+\.[^\s@]+$",
+                                                 max_length=254)]
+
+
+# pylint: disable=too-few-public-methods
+# reason: Mixin only adds construction of the schema from trusted ORM objects.
+class OrmFastConstructMixin:
+    """
+    Mixin for response schemas built from ORM objects already stored in the database.
+
+    The data coming from the database was validated on its way in,
+    so the schema is built with `model_construct` instead of being validated again.
+    """
+    # Names of the schema fields, cached when the schema class is created
+    RESPONSE_FIELDS: ClassVar[tuple[str, ...]] = ()
+    # Relationship fields holding lists of other fast constructed schemas
+    NESTED_FIELDS: ClassVar[dict[str, Any]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)  # type: ignore[misc]
+        cls.RESPONSE_FIELDS = tuple(cls.model_fields)  # type: ignore[attr-defined]
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Any:
+        """
+        Construct the schema from ORM object without validation.
+
+        :param obj: ORM object loaded from the database.
+
+        :return: Schema instance with values of the ORM object.
+        """
+        values = {}
+        for field in cls.RESPONSE_FIELDS:
+            value = getattr(obj, field)
+            nested = cls.NESTED_FIELDS.get(field)
+            if nested is not None and value is not None:
+                value = [nested.from_orm_fast(item) for item in value]
+            values[field] = value
+        return cls.model_construct(**values)  # type: ignore[attr-defined]
+
+# pylint: enable=too-few-public-methods
@@ -14,13 +14,23 @@ from crud import CRUDEvent, CRUDUser, CRUDReservationService, CRUDMiniService
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+# Names of the ACS API functions
+_ADD_VAR_SYMBOL = "AddVarSymbolSkupina"
+_DEL_VAR_SYMBOL = "DelVarSymbolSkupina"
+_GET_GROUPS_FOR_USE = "GetSkupinyForUse"
+_GET_ACCESS_VAR_SYMBOL = "GetPristupVarSymbol"
+_GET_ACCESS_GROUP = "GetPristupSkupina"
+
+
 class AbstractAccessCardSystemService(ABC):
     """
     This abstract class defines the interface for an email service.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    async def add_var_symbol(
+    def add_var_symbol(
             self,
             access_body: VarSymbolCreateUpdate
     ) -> dict:
@@ -33,7 +43,7 @@ class AbstractAccessCardSystemService(ABC):
         """
 
     @abstractmethod
-    async def del_var_symbol(
+    def del_var_symbol(
             self,
             access_body: VarSymbolDelete,
     ) -> dict:
@@ -46,7 +56,7 @@ class AbstractAccessCardSystemService(ABC):
         """
 
     @abstractmethod
-    async def get_groups_for_use(self):
+    def get_groups_for_use(self) -> dict:
         """
         Get the list of available groups for the API key.
 
@@ -54,7 +64,7 @@ class AbstractAccessCardSystemService(ABC):
         """
 
     @abstractmethod
-    async def get_access_var_symbol(
+    def get_access_var_symbol(
             self,
             var_symbol: str,
     ) -> dict:
@@ -67,7 +77,7 @@ class AbstractAccessCardSystemService(ABC):
         """
 
     @abstractmethod
-    async def get_access_group(
+    def get_access_group(
             self,
             group: str,
     ) -> dict:
@@ -100,6 +110,9 @@ class AccessCardSystemService(AbstractAccessCardSystemService):
     Class AccessCardSystemService represent service that work with Access Card System.
     """
 
+    __slots__ = ("event_crud", "user_crud", "reservation_service_crud",
+                 "mini_service_crud")
+
     def __init__(self, db: Annotated[
         AsyncSession, Depends(db_session.scoped_session_dependency)]):
         self.event_crud = CRUDEvent(db)
@@ -112,9 +125,7 @@ class AccessCardSystemService(AbstractAccessCardSystemService):
             service_event: Annotated[EventService, Depends(EventService)],
             access_request: ClubAccessSystemRequest
     ) -> bool:
-        user = await self.user_crud.get(access_request.uid)
-
-        if user is None:
+        if not await self.user_crud.exists(access_request.uid):
             raise PermissionDeniedException("This user isn't exist in system.")
 
         reservation_service = await self.reservation_service_crud.get_by_room_id(
@@ -125,7 +136,7 @@ class AccessCardSystemService(AbstractAccessCardSystemService):
             raise PermissionDeniedException("This room associated with some service isn't exist "
                                             "in system or use another access system")
 
-        event = await service_event.get_current_event_for_user(user.id)
+        event = await service_event.get_current_event_for_user(access_request.uid)
 
         if event is None:
             raise PermissionDeniedException("No available reservation exists at this time.")
@@ -134,65 +145,63 @@ class AccessCardSystemService(AbstractAccessCardSystemService):
             if access_request.device_id in mini_service.lockers_id:
                 return True
 
-        if reservation_service == await service_event.get_reservation_service_of_this_event(event):
+        # The calendar is joined to the event, no need to load its reservation service
+        if (reservation_service is not None) and (event.calendar is not None) and (
+                reservation_service.id == event.calendar.reservation_service_id):
             if access_request.device_id in reservation_service.lockers_id:
                 return True
 
-            for mini_service_name in event.additional_services:
-                mini_service = await self.mini_service_crud.get_by_name(mini_service_name)
-                if (mini_service.room_id is None) and (access_request.device_id in
-                                                       mini_service.lockers_id):
-                    return True
+            mini_services = await self.mini_service_crud.get_by_names(
+                event.additional_services)
+            if any((mini_service.room_id is None) and (access_request.device_id in
+                                                       mini_service.lockers_id)
+                   for mini_service in mini_services.values()):
+                return True
 
         raise PermissionDeniedException("No matching reservation exists at this time "
                                         "for this rules.")
 
-    async def add_var_symbol(
+    def add_var_symbol(
             self,
             access_body: VarSymbolCreateUpdate
     ) -> dict:
-        data = {
-            "funkce": "AddVarSymbolSkupina",
+        return {
+            "funkce": _ADD_VAR_SYMBOL,
             "varsymbol": access_body.var_symbol,
             "skupina": access_body.group,
             "platnostod": access_body.valid_from,
             "platnostdo": access_body.valid_to
         }
-        return data
 
-    async def del_var_symbol(
+    def del_var_symbol(
             self,
             access_body: VarSymbolDelete,
     ) -> dict:
-        data = {
-            "funkce": "DelVarSymbolSkupina",
+        return {
+            "funkce": _DEL_VAR_SYMBOL,
             "varsymbol": access_body.var_symbol,
             "skupina": access_body.group
         }
-        return data
 
-    async def get_groups_for_use(self):
-        data = {
-            "funkce": "GetSkupinyForUse",
+    def get_groups_for_use(self) -> dict:
+        return {
+            "funkce": _GET_GROUPS_FOR_USE,
         }
-        return data
 
-    async def get_access_var_symbol(
+    def get_access_var_symbol(
             self,
             var_symbol: str,
     ) -> dict:
-        data = {
-            "funkce": "GetPristupVarSymbol",
+        return {
+            "funkce": _GET_ACCESS_VAR_SYMBOL,
             "varsymbol": var_symbol
         }
-        return data
 
-    async def get_access_group(
+    def get_access_group(
             self,
             group: str,
     ) -> dict:
-        data = {
-            "funkce": "GetPristupSkupina",
+        return {
+            "funkce": _GET_ACCESS_GROUP,
             "skupina": group
         }
-        return data
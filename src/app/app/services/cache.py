@@ -0,0 +1,74 @@
+"""
+In-process cache for small, rarely changing lookups of the services.
+"""
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Cache of plain values which expire after the given number of seconds.
+
+    The cache lives in the worker process, so the services changing
+    the cached data invalidate it, and the expiration bounds
+    how long other workers can serve stale values.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Retrieve the value stored under the key.
+
+        :param key: Key of the value.
+
+        :return: The value if cached and not expired, None otherwise.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value under the key.
+
+        :param key: Key of the value.
+        :param value: The value, it must not be changed after it is stored.
+        """
+        if len(self._data) >= self.max_size and key not in self._data:
+            # Oldest inserted entry is dropped first
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove the value stored under the key.
+
+        :param key: Key of the value.
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all values.
+        """
+        self._data.clear()
+
+
+# Mini services of the calendars, keyed by the calendar id
+calendar_mini_services_cache = TTLCache(ttl=60)
+
+# Events with details listed by state, keyed by the reservation service alias and the state
+event_listing_cache = TTLCache(ttl=60)
+
+# Aliases of all reservation services, a single entry under ALIASES_KEY
+reservation_service_aliases_cache = TTLCache(ttl=300, max_size=1)
+ALIASES_KEY = "aliases"
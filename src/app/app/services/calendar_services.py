@@ -10,6 +10,7 @@ from api import BaseAppException, PermissionDeniedException
 from db import db_session
 from crud import CRUDCalendar, CRUDReservationService, CRUDMiniService
 from services import CrudServiceBase
+from services.cache import calendar_mini_services_cache, event_listing_cache
 from models import CalendarModel, ReservationServiceModel
 from schemas import CalendarCreate, CalendarUpdate, User
 from sqlalchemy import Row
@@ -27,6 +28,8 @@ class AbstractCalendarService(CrudServiceBase[
     that provides CRUD operations for a specific CalendarModel.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def create_calendar(
             self, calendar_create: CalendarCreate,
@@ -162,6 +165,8 @@ class CalendarService(AbstractCalendarService):
     Class CalendarService represent service that work with Calendar
     """
 
+    __slots__ = ("reservation_service_crud", "mini_service_crud")
+
     def __init__(self, db: Annotated[
         AsyncSession, Depends(db_session.scoped_session_dependency)]):
         self.reservation_service_crud = CRUDReservationService(db)
@@ -172,15 +177,16 @@ class CalendarService(AbstractCalendarService):
             self, calendar_create: CalendarCreate,
             user: User
     ) -> CalendarModel | None:
-        if await self.get(calendar_create.id, True):
+        conflict = await self.crud.exists_by_id_or_type(
+            calendar_create.id, calendar_create.reservation_type)
+
+        if conflict == "id":
             raise BaseAppException("A calendar with this id already exist.")
-        if await self.get_by_reservation_type(calendar_create.reservation_type, True):
+        if conflict == "reservation_type":
             raise BaseAppException("A calendar with this reservation type already exist.")
 
         reservation_service = await self.reservation_service_crud.get(
-            calendar_create.reservation_service_id
-        )
-
+            calendar_create.reservation_service_id)
         if reservation_service is None:
             raise BaseAppException("A reservation service of calendar isn't exist.")
         if reservation_service.alias not in user.roles:
@@ -189,43 +195,31 @@ class CalendarService(AbstractCalendarService):
             )
 
         if calendar_create.mini_services:
-            for mini_service in calendar_create.mini_services:
-                if mini_service not in \
-                        await self.mini_service_crud.get_names_by_reservation_service_id(
-                            reservation_service.id):
-                    raise BaseAppException("These mini services do not exist in the db "
-                                           "that you want to add to this calendar.")
-
-        if calendar_create.collision_with_calendar is not None:
-            for collision in calendar_create.collision_with_calendar:
-                existing_calendar = await self.get(collision)
-                if existing_calendar is None:
-                    raise BaseAppException("These calendar do not exist in the db "
-                                           "that you want to add to this calendar collision.")
-                collision_calendar_to_update = set(existing_calendar.collision_with_calendar)
-                collision_calendar_to_update.add(calendar_create.id)
-                update_exist_calendar = CalendarUpdate(
-                    collision_with_calendar=list(collision_calendar_to_update)
-                )
-                if not await self.update(collision, update_exist_calendar):
-                    raise BaseAppException("Failed to update collisions on the calendar "
-                                           f"with this id {collision}")
-
-        return await self.create(calendar_create)
+            existing_mini_services = set(
+                await self.mini_service_crud.get_names_by_reservation_service_id(
+                    reservation_service.id))
+            if not existing_mini_services.issuperset(calendar_create.mini_services):
+                raise BaseAppException("These mini services do not exist in the db "
+                                       "that you want to add to this calendar.")
+
+        collision_calendars = await self.crud.get_many(calendar_create.collision_with_calendar)
+        if len(collision_calendars) != len(set(calendar_create.collision_with_calendar)):
+            raise BaseAppException("These calendar do not exist in the db "
+                                   "that you want to add to this calendar collision.")
+
+        return await self.crud.create_with_collisions(calendar_create, collision_calendars)
 
     async def update_calendar(
             self, calendar_id: str,
             calendar_update: CalendarUpdate,
             user: User
     ) -> CalendarModel | None:
-        calendar_to_update = await self.get(calendar_id)
+        calendar_with_service = await self.crud.get_with_reservation_service(calendar_id)
 
-        if calendar_to_update is None:
+        if calendar_with_service is None:
             return None
 
-        reservation_service = await self.reservation_service_crud.get(
-            calendar_to_update.reservation_service_id
-        )
+        calendar_to_update, reservation_service = calendar_with_service
 
         if reservation_service is None:
             raise BaseAppException("A reservation service of calendar isn't exist.")
@@ -234,21 +228,25 @@ class CalendarService(AbstractCalendarService):
                 f"You must be the {reservation_service.name} manager to create calendars."
             )
 
-        return await self.update(calendar_id, calendar_update)
+        calendar = await self.crud.update(db_obj=calendar_to_update, obj_in=calendar_update)
+        # After the commit, so a concurrent read can't cache the old value again
+        calendar_mini_services_cache.invalidate(calendar_id)
+        event_listing_cache.clear()
+        return calendar
 
     async def retrieve_removed_object(
             self, uuid: UUID | str | int | None,
             user: User
     ) -> CalendarModel | None:
-        calendar = await self.get(uuid, True)
+        calendar_with_service = await self.crud.get_with_reservation_service(uuid, True)
 
-        if calendar.deleted_at is None:
-            raise BaseAppException("A calendar was not soft deleted.")
+        if calendar_with_service is None:
+            return None
 
-        reservation_service = await self.reservation_service_crud.get(
-            str(calendar.reservation_service_id)
-        )
+        calendar, reservation_service = calendar_with_service
 
+        if calendar.deleted_at is None:
+            raise BaseAppException("A calendar was not soft deleted.")
         if reservation_service is None:
             raise BaseAppException("A reservation service of calendar isn't exist.")
         if reservation_service.alias not in user.roles:
@@ -256,25 +254,26 @@ class CalendarService(AbstractCalendarService):
                 f"You must be the {reservation_service.name} manager to create calendars."
             )
 
-        return await self.crud.retrieve_removed_object(uuid)
+        restored_calendar = await self.crud.retrieve_removed_object(uuid)
+        calendar_mini_services_cache.invalidate(calendar.id)
+        event_listing_cache.clear()
+        return restored_calendar
 
     async def delete_calendar(
             self, calendar_id: str,
             user: User,
             hard_remove: bool = False
     ) -> CalendarModel | None:
-        calendar = await self.get(calendar_id, True)
+        calendar_with_service = await self.crud.get_with_reservation_service(calendar_id, True)
 
-        if calendar is None:
+        if calendar_with_service is None:
             return None
 
         if hard_remove and not user.section_head:
             raise PermissionDeniedException(
                 "You must be the head of PS to totally delete calendars.")
 
-        reservation_service = await self.reservation_service_crud.get(
-            calendar.reservation_service_id
-        )
+        calendar, reservation_service = calendar_with_service
 
         if reservation_service is None:
             raise BaseAppException("A reservation service of calendar isn't exist.")
@@ -283,20 +282,16 @@ class CalendarService(AbstractCalendarService):
                 f"You must be the {reservation_service.name} manager to create calendars."
             )
 
-        for calendar_to_update in reservation_service.calendars:
-            if calendar_to_update.collision_with_calendar and \
-                    calendar.id in calendar_to_update.collision_with_calendar:
-                collision_to_update = calendar_to_update.collision_with_calendar.copy()
-                collision_to_update.remove(calendar.id)
-                update_exist_calendar = CalendarUpdate(
-                    collision_with_calendar=collision_to_update
-                )
-                await self.update(calendar_to_update.id, update_exist_calendar)
+        # Committed in one transaction with the removal below
+        await self.crud.remove_from_collisions(calendar.id, reservation_service.id)
 
         if hard_remove:
-            return await self.crud.remove(calendar_id)
-
-        return await self.crud.soft_remove(calendar_id)
+            removed_calendar = await self.crud.remove(calendar_id)
+        else:
+            removed_calendar = await self.crud.soft_remove(calendar_id)
+        calendar_mini_services_cache.invalidate(calendar.id)
+        event_listing_cache.clear()
+        return removed_calendar
 
     async def get_all_google_calendar_to_add(
             self, user: User,
@@ -305,15 +300,18 @@ class CalendarService(AbstractCalendarService):
         if not user.roles:
             raise PermissionDeniedException()
 
-        new_calendar_candidates = []
+        # Owned calendars keyed by id, in the order of Google response
+        owned_calendars = {
+            calendar['id']: calendar for calendar in google_calendars.get('items', ())
+            if calendar.get('accessRole') == 'owner' and not calendar.get('primary', False)
+        }
+        if not owned_calendars:
+            return []
 
-        for calendar in google_calendars.get('items', []):
-            if calendar.get('accessRole') == 'owner' and not \
-                    calendar.get('primary', False):
-                if await self.get(calendar.get('id', None)) is None:
-                    new_calendar_candidates.append(calendar)
+        existing_ids = await self.crud.existing_ids(list(owned_calendars))
 
-        return new_calendar_candidates
+        return [calendar for calendar_id, calendar in owned_calendars.items()
+                if calendar_id not in existing_ids]
 
     async def get_by_reservation_type(
             self, reservation_type: str,
@@ -325,11 +323,17 @@ class CalendarService(AbstractCalendarService):
     async def get_mini_services_by_calendar(
             self, calendar_id: str
     ) -> list[str] | None:
+        mini_services = calendar_mini_services_cache.get(calendar_id)
+        if mini_services is not None:
+            return list(mini_services)
+
         calendar = await self.crud.get(calendar_id)
 
         if calendar is None:
             return None
 
+        if calendar.mini_services is not None:
+            calendar_mini_services_cache.set(calendar_id, tuple(calendar.mini_services))
         return calendar.mini_services
 
     async def get_reservation_service_of_this_calendar(
@@ -1,8 +1,10 @@
 """
 This module defines an abstract base class AbstractEmailService that work with Email.
 """
-import shutil
-import os
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 from typing import Any
 from datetime import datetime
@@ -11,6 +13,81 @@ from abc import ABC, abstractmethod
 from schemas import RegistrationFormCreate, User, EmailCreate
 from pypdf import PdfReader, PdfWriter
 
+# The template never changes, so it is read from disk only once
+_TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "templates" / "event_registration.pdf"
+_TEMPLATE_BYTES = _TEMPLATE_PATH.read_bytes()
+
+# Pool for filling the PDF forms, created with the first form.
+# One process per app worker, forms are rare and each worker already has its own pool
+_PDF_EXECUTOR: ProcessPoolExecutor | None = None
+
+
+# pylint: disable=global-statement
+# reason: One pool is shared by the whole worker process.
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """
+    Returns the process pool used for filling the PDF forms.
+    """
+    global _PDF_EXECUTOR
+    if _PDF_EXECUTOR is None:
+        _PDF_EXECUTOR = ProcessPoolExecutor(max_workers=1)
+    return _PDF_EXECUTOR
+
+
+def shutdown_pdf_executor() -> None:
+    """
+    Shuts down the process pool used for filling the PDF forms, if it was created.
+    """
+    global _PDF_EXECUTOR
+    if _PDF_EXECUTOR is not None:
+        _PDF_EXECUTOR.shutdown()
+        _PDF_EXECUTOR = None
+
+# pylint: enable=global-statement
+
+
+def fill_registration_form(registration_form: RegistrationFormCreate,
+                           full_name: str) -> bytes:
+    """
+    Fills the registration form template. Module level function,
+    so it can be run in the process pool.
+
+    :param registration_form: Input data for adding in pdf.
+    :param full_name: User fullname.
+
+    :return: Content of the filled PDF.
+    """
+    # Open the template from memory and fill form fields
+    reader = PdfReader(io.BytesIO(_TEMPLATE_BYTES))
+    writer = PdfWriter()
+
+    # Fill the fields
+    writer.append(reader)
+
+    formatted_start_date = registration_form.event_start.strftime("%H:%M, %d/%m/%Y")
+    formatted_end_date = registration_form.event_end.strftime("%H:%M, %d/%m/%Y")
+
+    writer.update_page_form_field_values(
+        writer.pages[0],  # Targeting the first page
+        {
+            "purpose": registration_form.event_name,
+            "guests": str(registration_form.guests),
+            "start_date": formatted_start_date,
+            "end_date": formatted_end_date,
+            "full_name": full_name,
+            "email": str(registration_form.email),
+            "organizers": registration_form.organizers,
+            "space": registration_form.space,
+            "other_spaces": ", ".join(registration_form.other_space or []),
+            "today_date": datetime.today().strftime("%d/%m/%Y"),
+        }
+    )
+
+    # Keep the filled PDF in memory
+    output_pdf = io.BytesIO()
+    writer.write(output_pdf)
+    return output_pdf.getvalue()
+
 
 # pylint: disable=too-few-public-methods
 # reason: Methods will be added in the next versions of the program
@@ -20,7 +97,7 @@ class AbstractEmailService(ABC):
     """
 
     @abstractmethod
-    def prepare_registration_form(
+    async def prepare_registration_form(
             self, registration_form: RegistrationFormCreate,
             full_name: User
     ) -> Any:
@@ -38,46 +115,13 @@ class EmailService(AbstractEmailService):
     Class EmailService represent service that work with Email
     """
 
-    def prepare_registration_form(
+    async def prepare_registration_form(
             self, registration_form: RegistrationFormCreate,
             full_name: str
     ) -> EmailCreate:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        original_pdf_path = os.path.join(base_dir, '..', 'templates', 'event_registration.pdf')
-        output_path = "/tmp/event_registration.pdf"
-
-        # Make a copy of the original PDF
-        shutil.copy(original_pdf_path, output_path)
-
-        # Open the copied PDF and fill form fields
-        reader = PdfReader(output_path)
-        writer = PdfWriter()
-
-        # Fill the fields
-        writer.append(reader)
-
-        formatted_start_date = registration_form.event_start.strftime("%H:%M, %d/%m/%Y")
-        formatted_end_date = registration_form.event_end.strftime("%H:%M, %d/%m/%Y")
-
-        writer.update_page_form_field_values(
-            writer.pages[0],  # Targeting the first page
-            {
-                "purpose": registration_form.event_name,
-                "guests": str(registration_form.guests),
-                "start_date": formatted_start_date,
-                "end_date": formatted_end_date,
-                "full_name": full_name,
-                "email": str(registration_form.email),
-                "organizers": registration_form.organizers,
-                "space": registration_form.space,
-                "other_spaces": ", ".join(registration_form.other_space or []),
-                "today_date": datetime.today().strftime("%d/%m/%Y"),
-            }
-        )
-
-        # Save the filled PDF
-        with open(output_path, "wb") as output_pdf:
-            writer.write(output_pdf)
+        # pypdf is pure Python, filling the form would block the event loop
+        pdf = await asyncio.get_running_loop().run_in_executor(
+            get_pdf_executor(), fill_registration_form, registration_form, full_name)
 
         email_create = EmailCreate(
             email=[registration_form.email, registration_form.manager_contact_mail],
@@ -85,7 +129,8 @@ class EmailService(AbstractEmailService):
             body=(
                 f"Request to reserve an event for a member {full_name}"
             ),
-            attachment=output_path
+            attachment=pdf,
+            attachment_name="event_registration.pdf"
         )
 
         return email_create
@@ -4,21 +4,30 @@ This module defines an abstract base class AbstractEventService that work with E
 import datetime as dt
 from typing import Any, Annotated
 from abc import ABC, abstractmethod
+from uuid import UUID
 
 from models import CalendarModel, EventModel, EventState, ReservationServiceModel, UserModel
 from services.utils import ready_event, first_standard_check, \
-    dif_days_res, reservation_in_advance
+    dif_days_res, reservation_in_advance, encode_events_cursor, decode_events_cursor
 from services import CrudServiceBase
+from services.cache import event_listing_cache
 from fastapi import Depends
 
 from api import BaseAppException, PermissionDeniedException
 from schemas import EventCreate, User, ServiceValidity, Calendar, \
-    EventCreateToDb, EventUpdate, Event, EventUpdateTime, ReservationService, \
-    EventWithExtraDetails
+    EventCreateToDb, EventUpdate, Event, EventUpdateTime, \
+    EventWithExtraDetails, EventsPage
 from db import db_session
 from crud import CRUDReservationService, CRUDEvent, CRUDCalendar, CRUDUser
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# States from which the reservation can still be changed or canceled
+_NOT_CANCELED_STATES = tuple(state for state in EventState if state != EventState.CANCELED)
+# States from which the user can request a change of the reservation time
+_UPDATE_REQUESTABLE_STATES = tuple(
+    state for state in _NOT_CANCELED_STATES if state != EventState.UPDATE_REQUESTED)
+
 
 # pylint: disable=too-few-public-methods
 # reason: Methods will be added in the next versions of the program
@@ -32,6 +41,8 @@ class AbstractEventService(CrudServiceBase[
     This abstract class defines the interface for an event service.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def post_event(self, event_input: EventCreate, services: list[ServiceValidity],
                          user: User, calendar: Calendar) -> Any:
@@ -76,6 +87,22 @@ class AbstractEventService(CrudServiceBase[
         to user id or empty list if no such events exists.
         """
 
+    @abstractmethod
+    async def get_page_by_user_id(
+            self, user_id: int,
+            limit: int,
+            cursor: str | None = None,
+    ) -> EventsPage:
+        """
+        Retrieves one page of the Events by user id, newest first.
+
+        :param user_id: user id of the events.
+        :param limit: Maximum number of the events in the page.
+        :param cursor: Cursor of the page or None for the first page.
+
+        :return: Page of events with cursor of the next page.
+        """
+
     @abstractmethod
     async def get_by_event_state_by_reservation_service_alias(
             self, reservation_service_alias: str,
@@ -204,12 +231,18 @@ class EventService(AbstractEventService):
     Class EventService represent service that work with Event
     """
 
+    __slots__ = ("reservation_service_crud", "calendar_crud", "user_crud",
+                 "__calendars_with_service")
+
     def __init__(self, db: Annotated[
         AsyncSession, Depends(db_session.scoped_session_dependency)]):
         super().__init__(CRUDEvent(db))
         self.reservation_service_crud = CRUDReservationService(db)
         self.calendar_crud = CRUDCalendar(db)
         self.user_crud = CRUDUser(db)
+        # Calendars with their reservation services already looked up in this request
+        self.__calendars_with_service: dict[
+            str, tuple[CalendarModel, ReservationServiceModel | None] | None] = {}
 
     async def post_event(
             self, event_input: EventCreate,
@@ -245,18 +278,52 @@ class EventService(AbstractEventService):
             calendar_id=event_create.reservation_type,
             additional_services=event_create.additional_services
         )
-        return await self.crud.create(event_create_to_db)
+        event = await self.crud.create(event_create_to_db)
+        event_listing_cache.clear()
+        return event
+
+    async def update(self, uuid: UUID | str | int,
+                     obj_in: EventUpdate | EventUpdateTime) -> EventModel | None:
+        event = await super().update(uuid, obj_in)
+        event_listing_cache.clear()
+        return event
 
     async def get_by_user_id(
             self, user_id: int,
     ) -> list[EventWithExtraDetails] | None:
-        events = await self.crud.get_by_user_id(user_id)
-        return await self.__add_extra_details_to_event(events)
+        rows = await self.crud.get_details_by_user_id(user_id)
+        return self.__add_extra_details_to_event(rows)
+
+    async def get_page_by_user_id(
+            self, user_id: int,
+            limit: int,
+            cursor: str | None = None,
+    ) -> EventsPage:
+        try:
+            after = decode_events_cursor(cursor) if cursor else None
+        except ValueError as exc:
+            raise BaseAppException("Invalid cursor.") from exc
+
+        # One extra event tells if there is a next page
+        events = await self.crud.get_page_by_user_id(user_id, limit + 1, after)
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_events_cursor(events[-1].start_datetime, events[-1].id)
+        return EventsPage.model_construct(
+            items=[Event.from_orm_fast(event) for event in events],
+            next_cursor=next_cursor
+        )
 
     async def get_by_event_state_by_reservation_service_alias(
             self, reservation_service_alias: str,
             event_state: EventState,
     ) -> list[EventWithExtraDetails]:
+        key = (reservation_service_alias, event_state)
+        cached = event_listing_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         reservation_service = await self.reservation_service_crud.get_by_alias(
             reservation_service_alias)
 
@@ -264,10 +331,12 @@ class EventService(AbstractEventService):
             raise BaseAppException("A reservation service with this alias isn't exist.",
                                    status_code=404)
 
-        events = await self.crud.get_by_event_state_by_reservation_service_id(
+        rows = await self.crud.get_details_by_event_state_by_reservation_service_id(
             reservation_service.id, event_state)
 
-        return await self.__add_extra_details_to_event(events)
+        events_with_details = self.__add_extra_details_to_event(rows)
+        event_listing_cache.set(key, tuple(events_with_details))
+        return events_with_details
 
     async def get_reservation_service_of_this_event(
             self, event: Event,
@@ -276,13 +345,12 @@ class EventService(AbstractEventService):
             raise BaseAppException("This event does not exist in db.",
                                    status_code=404)
 
-        calendar: Calendar = await self.calendar_crud.get(event.calendar_id)
-        if not calendar:
+        calendar_with_service = await self.__get_calendar_with_service(event.calendar_id)
+        if not calendar_with_service:
             raise BaseAppException("A calendar of this event isn't exist.",
                                    status_code=404)
 
-        reservation_service: ReservationService = await (self.reservation_service_crud.
-                                                         get(calendar.reservation_service_id))
+        _, reservation_service = calendar_with_service
         if not reservation_service:
             raise BaseAppException("A reservation service of this event isn't exist.",
                                    status_code=404)
@@ -296,11 +364,12 @@ class EventService(AbstractEventService):
             raise BaseAppException("This event does not exist in db.",
                                    status_code=404)
 
-        calendar: Calendar = await self.calendar_crud.get(event.calendar_id)
-        if not calendar:
+        calendar_with_service = await self.__get_calendar_with_service(event.calendar_id)
+        if not calendar_with_service:
             raise BaseAppException("A calendar of this event isn't exist.",
                                    status_code=404)
 
+        calendar, _ = calendar_with_service
         return calendar
 
     async def get_user_of_this_event(
@@ -310,7 +379,8 @@ class EventService(AbstractEventService):
             raise BaseAppException("This event does not exist in db.",
                                    status_code=404)
 
-        user = await self.user_crud.get(event.user_id)
+        # Usually the user who makes the request, already in the session
+        user = await self.user_crud.get_by_id(event.user_id)
 
         if not user:
             raise BaseAppException("A user of this event isn't exist.",
@@ -326,7 +396,8 @@ class EventService(AbstractEventService):
     async def approve_update_reservation_time(self, uuid: str,
                                               event_update: EventUpdate,
                                               user: User) -> EventModel | None:
-        event_to_update = await self.get(uuid)
+        # Already loaded by the endpoint, taken from the session
+        event_to_update = await self.crud.get_by_id(uuid)
 
         if event_to_update is None:
             return None
@@ -341,44 +412,58 @@ class EventService(AbstractEventService):
                 f"You must be the {reservation_service.name} manager to update this event."
             )
 
-        return await self.update(uuid, event_update)
+        event = await self.crud.transition_state(
+            uuid, _NOT_CANCELED_STATES, event_update.model_dump(exclude_unset=True)
+        )
+        if event is None:
+            raise BaseAppException("You can't change canceled reservation.")
+        event_listing_cache.clear()
+        return event
 
     async def request_update_reservation_time(self, uuid: str,
                                               event_update: EventUpdateTime,
                                               user: User) -> EventModel | None:
+        # One time for the UPDATE and the explanation of its result
+        now = dt.datetime.now()
+        event = await self.crud.transition_state(
+            uuid, _UPDATE_REQUESTABLE_STATES,
+            {"start_datetime": event_update.start_datetime,
+             "end_datetime": event_update.end_datetime,
+             "event_state": EventState.UPDATE_REQUESTED},
+            not_started_at=now
+        )
+        if event is not None:
+            event_listing_cache.clear()
+            return event
+
+        # Nothing was updated, find out why
         event_to_update = await self.get(uuid)
 
         if not event_to_update:
             return None
 
-        if event_to_update.start_datetime < dt.datetime.now():
+        if event_to_update.start_datetime <= now:
             raise BaseAppException("You cannot change the reservation time after it has started.")
 
         if event_to_update.event_state == EventState.CANCELED:
             raise BaseAppException("You can't change canceled reservation.")
 
-        if event_to_update.event_state == EventState.UPDATE_REQUESTED:
-            raise BaseAppException("You can't change reservation in state update requested.")
-
-        event_update_time = EventUpdate(
-            start_datetime=event_update.start_datetime,
-            end_datetime=event_update.end_datetime,
-            event_state=EventState.UPDATE_REQUESTED
-        )
-        return await self.update(uuid, event_update_time)
+        raise BaseAppException("You can't change reservation in state update requested.")
 
     async def cancel_event(
             self, uuid: str,
             user: User
     ) -> EventModel | None:
-        event: Event = await self.get(uuid)
+        event: Event = await self.crud.get_by_id(uuid)
         if not event:
             return None
 
         if event.event_state == EventState.CANCELED:
             raise BaseAppException("You can't cancel canceled reservation.")
 
-        if event.start_datetime < dt.datetime.now():
+        # One time for the check and the UPDATE
+        now = dt.datetime.now()
+        if event.start_datetime <= now:
             raise BaseAppException("You cannot cancel the reservation after it has started.")
 
         reservation_service = await self.get_reservation_service_of_this_event(event)
@@ -388,32 +473,41 @@ class EventService(AbstractEventService):
                 raise PermissionDeniedException("You do not have permission to cancel a "
                                                 "reservation made by another user.")
 
-        updated_event = EventUpdate(
-            event_state=EventState.CANCELED
+        event = await self.crud.transition_state(
+            uuid, _NOT_CANCELED_STATES, {"event_state": EventState.CANCELED},
+            not_started_at=now
         )
-
-        return await self.update(uuid, updated_event)
+        if event is None:
+            raise BaseAppException("The reservation was canceled or has already started.")
+        event_listing_cache.clear()
+        return event
 
     async def confirm_event(
             self, uuid: str | None,
             user: User
     ) -> EventModel | None:
-        event: Event = await self.get(uuid)
+        # The state and the permission are checked by the UPDATE itself
+        event = await self.crud.transition_state(
+            uuid, (EventState.NOT_APPROVED,), {"event_state": EventState.CONFIRMED},
+            manager_roles=user.roles or ()
+        )
+        if event is not None:
+            event_listing_cache.clear()
+            return event
+
+        # Nothing was confirmed, find out why
+        event = await self.get(uuid)
         if not event:
             return None
 
-        if event.event_state != EventState.NOT_APPROVED:
-            raise BaseAppException("You cannot approve a reservation that is not in the "
-                                   "'not approved' state.")
-
-        reservation_service = await self.get_reservation_service_of_this_event(event)
-
-        if reservation_service.alias not in user.roles:
+        if event.event_state == EventState.NOT_APPROVED:
+            reservation_service = await self.get_reservation_service_of_this_event(event)
             raise PermissionDeniedException(
                 f"You must be the {reservation_service.name} manager to approve this reservation."
             )
 
-        return await self.crud.confirm_event(uuid)
+        raise BaseAppException("You cannot approve a reservation that is not in the "
+                               "'not approved' state.")
 
     async def __control_conditions_and_permissions(
             self, user: User,
@@ -434,11 +528,16 @@ class EventService(AbstractEventService):
         """
         reservation_service = await self.reservation_service_crud.get(
             calendar.reservation_service_id)
+        if reservation_service is None:
+            return {"message": "Reservation service of this calendar isn't exist!"}
+
+        # All the time checks of the reservation use the same time
+        now = dt.datetime.now()
 
         # Check of the membership
         standard_message = first_standard_check(services, reservation_service,
                                                 event_input.start_datetime,
-                                                event_input.end_datetime)
+                                                event_input.end_datetime, now)
         if not standard_message == "Access":
             return standard_message
 
@@ -448,63 +547,90 @@ class EventService(AbstractEventService):
                                f"reservation for more than {calendar.max_people} people!"}
 
         # Choose user rules
-        user_rules = await self.__choose_user_rules(user, calendar)
+        user_rules = self.__choose_user_rules(user, calendar, reservation_service)
 
         # Reservation no more than 24 hours
         if not dif_days_res(event_input.start_datetime, event_input.end_datetime, user_rules):
             return {"message": "You can reserve on different day."}
 
         # Check reservation in advance and prior
-        message = reservation_in_advance(event_input.start_datetime, user_rules)
+        message = reservation_in_advance(event_input.start_datetime, user_rules, now)
         if not message == "Access":
             return message
 
         return "Access"
 
-    async def __choose_user_rules(
-            self, user: User,
-            calendar: CalendarModel
+    @staticmethod
+    def __choose_user_rules(
+            user: User,
+            calendar: CalendarModel,
+            reservation_service: ReservationServiceModel
     ):
         """
         Choose user rules based on the calendar rules and user roles.
 
         :param user: User object in db.
         :param calendar: Calendar object in db.
+        :param reservation_service: Reservation Service of the calendar.
 
         :return: Rules object.
         """
-        reservation_service = await self.reservation_service_crud.get(
-            calendar.reservation_service_id)
-
         if not user.active_member:
             return calendar.club_member_rules
         if reservation_service.alias in user.roles:
             return calendar.manager_rules
         return calendar.active_member_rules
 
-    async def __add_extra_details_to_event(
-            self, events: list[Event]
+    async def __get_calendar_with_service(
+            self, calendar_id: str
+    ) -> tuple[CalendarModel, ReservationServiceModel | None] | None:
+        """
+        Retrieve the calendar with its reservation service, at most once per request.
+        EventService doesn't change calendars nor reservation services,
+        so the memoized pair stays valid for the whole request.
+
+        :param calendar_id: The id of the calendar.
+
+        :return: The calendar and its reservation service, None if no such calendar.
+        """
+        if calendar_id not in self.__calendars_with_service:
+            # The calendar and its reservation service depend on each other,
+            # one query for both
+            self.__calendars_with_service[calendar_id] = \
+                await self.calendar_crud.get_with_reservation_service(calendar_id)
+        return self.__calendars_with_service[calendar_id]
+
+    @staticmethod
+    def __add_extra_details_to_event(
+            rows: list[Row]
     ) -> list[EventWithExtraDetails]:
         """
-        Enrich a list of Event objects data.
+        Build EventWithExtraDetails from the rows of the event values
+        and the names of its calendar, user and reservation service.
 
-        :param events: A list of Event objects to be enriched.
+        :param rows: Rows of the events with their details.
 
         :return: A list of EventWithExtraDetails, containing
         the original event and related metadata.
         """
         result = []
 
-        for event in events:
-            calendar = await self.get_calendar_of_this_event(event)
-            user = await self.get_user_of_this_event(event)
-            reservation_service = await  self.get_reservation_service_of_this_event(event)
-
-            event_with_details = EventWithExtraDetails(
-                event=event,
-                reservation_type=calendar.reservation_type,
-                user_name=user.full_name,
-                reservation_service_name=reservation_service.name
+        for row in rows:
+            if row.reservation_type is None:
+                raise BaseAppException("A calendar of this event isn't exist.",
+                                       status_code=404)
+            if row.user_name is None:
+                raise BaseAppException("A user of this event isn't exist.",
+                                       status_code=404)
+            if row.reservation_service_name is None:
+                raise BaseAppException("A reservation service of this event isn't exist.",
+                                       status_code=404)
+
+            event_with_details = EventWithExtraDetails.model_construct(
+                event=Event.from_orm_fast(row),
+                reservation_type=row.reservation_type,
+                user_name=row.user_name,
+                reservation_service_name=row.reservation_service_name
             )
             result.append(event_with_details)
 
@@ -10,9 +10,11 @@ from fastapi import Depends
 from api import BaseAppException, PermissionDeniedException
 from crud import CRUDMiniService, CRUDCalendar, CRUDReservationService
 from services import CrudServiceBase
+from services.cache import calendar_mini_services_cache
 from models import MiniServiceModel
-from schemas import MiniServiceCreate, MiniServiceUpdate, CalendarUpdate, User
+from schemas import MiniServiceCreate, MiniServiceUpdate, User
 from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -27,6 +29,8 @@ class AbstractMiniServiceService(CrudServiceBase[
     that provides CRUD operations for a specific MiniServiceModel.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def create_mini_service(self, mini_service_create: MiniServiceCreate,
                                   user: User) -> MiniServiceModel | None:
@@ -131,6 +135,8 @@ class MiniServiceService(AbstractMiniServiceService):
     Class MiniServiceService represent service that work with Mini Service
     """
 
+    __slots__ = ("calendar_crud", "reservation_service_crud")
+
     def __init__(self, db: Annotated[
         AsyncSession, Depends(db_session.scoped_session_dependency)]):
         self.calendar_crud = CRUDCalendar(db)
@@ -139,9 +145,6 @@ class MiniServiceService(AbstractMiniServiceService):
 
     async def create_mini_service(self, mini_service_create: MiniServiceCreate,
                                   user: User) -> MiniServiceModel | None:
-        if await self.crud.get_by_name(mini_service_create.name, True):
-            raise BaseAppException("A reservation service with this name already exist.")
-
         reservation_service = await self.reservation_service_crud.get(
             mini_service_create.reservation_service_id
         )
@@ -153,19 +156,24 @@ class MiniServiceService(AbstractMiniServiceService):
                 f"You must be the {reservation_service.name} manager to create mini services."
             )
 
-        return await self.crud.create(mini_service_create)
+        # The name is unique in the table, the insert itself checks it
+        try:
+            return await self.crud.create_in_savepoint(mini_service_create)
+        except IntegrityError as exc:
+            if await self.crud.get_by_name(mini_service_create.name, True):
+                raise BaseAppException(
+                    "A reservation service with this name already exist.") from exc
+            raise
 
     async def update_mini_service(self, uuid: UUID,
                                   mini_service_update: MiniServiceUpdate,
                                   user: User) -> MiniServiceModel | None:
-        mini_service_to_update = await self.get(uuid)
+        mini_service_with_service = await self.crud.get_with_reservation_service(uuid)
 
-        if mini_service_to_update is None:
+        if mini_service_with_service is None:
             return None
 
-        reservation_service = await self.reservation_service_crud.get(
-            mini_service_to_update.reservation_service_id
-        )
+        mini_service_to_update, reservation_service = mini_service_with_service
 
         if reservation_service is None:
             raise BaseAppException("A reservation service of mini service isn't exist.")
@@ -174,20 +182,22 @@ class MiniServiceService(AbstractMiniServiceService):
                 f"You must be the {reservation_service.name} manager to update mini services."
             )
 
-        return await self.update(uuid, mini_service_update)
+        return await self.crud.update(db_obj=mini_service_to_update,
+                                      obj_in=mini_service_update)
 
     async def retrieve_removed_object(self, uuid: UUID | str | int | None,
                                       user: User
                                       ) -> MiniServiceModel | None:
-        mini_service = await self.crud.get(uuid, True)
+        mini_service_with_service = await self.crud.get_with_reservation_service(uuid, True)
+
+        if mini_service_with_service is None:
+            return None
+
+        mini_service, reservation_service = mini_service_with_service
 
         if mini_service.deleted_at is None:
             raise BaseAppException("A mini service was not soft deleted.")
 
-        reservation_service = await self.reservation_service_crud.get(
-            str(mini_service.reservation_service_id)
-        )
-
         if reservation_service is None:
             raise BaseAppException("A reservation service of mini service isn't exist.")
         if reservation_service.alias not in user.roles:
@@ -201,18 +211,16 @@ class MiniServiceService(AbstractMiniServiceService):
                                   user: User,
                                   hard_remove: bool = False
                                   ) -> MiniServiceModel | None:
-        mini_service = await self.crud.get(uuid, True)
+        mini_service_with_service = await self.crud.get_with_reservation_service(uuid, True)
 
-        if mini_service is None:
+        if mini_service_with_service is None:
             return None
 
         if hard_remove and not user.section_head:
             raise PermissionDeniedException(
                 "You must be the head of PS to totally delete mini services.")
 
-        reservation_service = await self.reservation_service_crud.get(
-            mini_service.reservation_service_id
-        )
+        mini_service, reservation_service = mini_service_with_service
 
         if reservation_service is None:
             raise BaseAppException("A reservation service of mini service isn't exist.")
@@ -221,19 +229,18 @@ class MiniServiceService(AbstractMiniServiceService):
                 f"You must be the {reservation_service.name} manager to delete mini services."
             )
 
-        for calendar in reservation_service.calendars:
-            if mini_service.name in calendar.mini_services:
-                list_of_mini_services = calendar.mini_services.copy()
-                list_of_mini_services.remove(mini_service.name)
-                update_exist_calendar = CalendarUpdate(
-                    mini_services=list_of_mini_services
-                )
-                await self.calendar_crud.update(db_obj=calendar, obj_in=update_exist_calendar)
+        # Committed together with the removal of the mini service
+        changed_calendar_ids = await self.calendar_crud.remove_mini_service(
+            mini_service.name, reservation_service.id)
 
         if hard_remove:
-            return await self.crud.remove(uuid)
-
-        return await self.crud.soft_remove(uuid)
+            removed_mini_service = await self.crud.remove(uuid)
+        else:
+            removed_mini_service = await self.crud.soft_remove(uuid)
+        # After the commit, so a concurrent read can't cache the old value again
+        for calendar_id in changed_calendar_ids:
+            calendar_mini_services_cache.invalidate(calendar_id)
+        return removed_mini_service
 
     async def get_by_name(self, name: str,
                           include_removed: bool = False) -> MiniServiceModel | None:
@@ -8,12 +8,14 @@ from uuid import UUID
 
 from db import db_session
 from fastapi import Depends
-from crud import CRUDReservationService, CRUDCalendar, CRUDMiniService
+from crud import CRUDReservationService
 from api import BaseAppException, PermissionDeniedException
 from services import CrudServiceBase
+from services.cache import reservation_service_aliases_cache, ALIASES_KEY, \
+    event_listing_cache
 from models import ReservationServiceModel
 from schemas import ReservationServiceCreate, ReservationServiceUpdate, User
-from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -28,6 +30,8 @@ class AbstractReservationServiceService(CrudServiceBase[
     that provides CRUD operations for a specific ReservationServiceModel.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def create_reservation_service(self, reservation_service_create: ReservationServiceCreate,
                                          user: User) -> ReservationServiceModel | None:
@@ -123,13 +127,14 @@ class AbstractReservationServiceService(CrudServiceBase[
     @abstractmethod
     async def get_public_services(
             self, include_removed: bool = False
-    ) -> list[Row[ReservationServiceModel]] | None:
+    ) -> list[ReservationServiceModel]:
         """
-        Retrieves a public Reservation Service instance.
+        Retrieves public Reservation Services with their calendars
+        and mini services already loaded.
 
         :param include_removed: Include removed object or not.
 
-        :return: The public Reservation Service instance if found, None otherwise.
+        :return: list of public Reservation Services.
         """
 
     @abstractmethod
@@ -150,23 +155,30 @@ class ReservationServiceService(AbstractReservationServiceService):
     Class MiniServiceService represent service that work with Mini Service
     """
 
+    __slots__ = ()
+
     def __init__(self, db: Annotated[
         AsyncSession, Depends(db_session.scoped_session_dependency)]):
         super().__init__(CRUDReservationService(db))
-        self.calendar_crud = CRUDCalendar(db)
-        self.mini_service_crud = CRUDMiniService(db)
 
     async def create_reservation_service(self, reservation_service_create: ReservationServiceCreate,
                                          user: User) -> ReservationServiceModel | None:
-        if await self.crud.get_by_name(reservation_service_create.name, True):
-            raise BaseAppException("A reservation service with this name already exist.")
-        if await self.crud.get_by_alias(reservation_service_create.alias, True):
-            raise BaseAppException("A reservation service with this alias already exist.")
-
         if not user.section_head:
             raise PermissionDeniedException("You must be the head of PS to create services.")
 
-        return await self.crud.create(reservation_service_create)
+        # The name and the alias are unique in the table, the insert itself checks them
+        try:
+            reservation_service = await self.crud.create_in_savepoint(
+                reservation_service_create)
+        except IntegrityError as exc:
+            conflict = await self.crud.exists_by_name_or_alias(
+                reservation_service_create.name, reservation_service_create.alias)
+            if conflict is None:
+                raise
+            raise BaseAppException(
+                f"A reservation service with this {conflict} already exist.") from exc
+        reservation_service_aliases_cache.invalidate(ALIASES_KEY)
+        return reservation_service
 
     async def update_reservation_service(self, uuid: UUID,
                                          reservation_service_update: ReservationServiceUpdate,
@@ -174,7 +186,10 @@ class ReservationServiceService(AbstractReservationServiceService):
         if not user.section_head:
             raise PermissionDeniedException("You must be the head of PS to update services.")
 
-        return await self.update(uuid, reservation_service_update)
+        reservation_service = await self.update(uuid, reservation_service_update)
+        reservation_service_aliases_cache.invalidate(ALIASES_KEY)
+        event_listing_cache.clear()
+        return reservation_service
 
     async def retrieve_removed_object(self, uuid: UUID | str | int | None,
                                       user: User
@@ -183,7 +198,10 @@ class ReservationServiceService(AbstractReservationServiceService):
             raise PermissionDeniedException(
                 "You must be the head of PS to retrieve removed services.")
 
-        return await self.crud.retrieve_removed_object(uuid)
+        reservation_service = await self.crud.retrieve_removed_object(uuid)
+        reservation_service_aliases_cache.invalidate(ALIASES_KEY)
+        event_listing_cache.clear()
+        return reservation_service
 
     async def delete_reservation_service(
             self, uuid: UUID,
@@ -194,13 +212,16 @@ class ReservationServiceService(AbstractReservationServiceService):
             raise PermissionDeniedException("You must be the head of PS to delete services.")
 
         if hard_remove:
-            return await self.crud.remove(uuid)
-
-        return await self.crud.soft_remove(uuid)
+            reservation_service = await self.crud.remove(uuid)
+        else:
+            reservation_service = await self.crud.soft_remove(uuid)
+        reservation_service_aliases_cache.invalidate(ALIASES_KEY)
+        event_listing_cache.clear()
+        return reservation_service
 
     async def get_by_alias(self, alias: str,
                            include_removed: bool = False) -> ReservationServiceModel | None:
-        return await self.crud.get_by_alias(alias, include_removed)
+        return await self.crud.get_detail_by_alias(alias, include_removed)
 
     async def get_by_name(self, name: str,
                           include_removed: bool = False) -> ReservationServiceModel | None:
@@ -214,27 +235,10 @@ class ReservationServiceService(AbstractReservationServiceService):
 
     async def get_public_services(
             self, include_removed: bool = False
-    ) -> list[Row[ReservationServiceModel]] | None:
-        services = await self.crud.get_public_services(include_removed)
-        if len(services) == 0:
-            return []
-        return services
+    ) -> list[ReservationServiceModel]:
+        return await self.crud.get_public_services(include_removed)
 
     async def get_all_services_include_all_removed(
             self,
     ) -> list[ReservationServiceModel]:
-        reservation_services: list[ReservationServiceModel] = await self.crud.get_all(True)
-
-        for reservation_service in reservation_services:
-            calendars = await self.calendar_crud.get_by_reservation_service_id(
-                reservation_service.id, include_removed=True
-            )
-
-            mini_services = await self.mini_service_crud.get_by_reservation_service_id(
-                reservation_service.id, include_removed=True
-            )
-
-            reservation_service.calendars = calendars
-            reservation_service.mini_services = mini_services
-
-        return reservation_services
+        return await self.crud.get_all_with_children(True)
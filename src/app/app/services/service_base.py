@@ -31,6 +31,8 @@ class AbstractCRUDService(ABC, Generic[Model, Crud, CreateSchema, UpdateSchema])
     objects of any type `ModelType`.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def get(self, uuid: UUID | str | int,
             include_removed: bool = False) -> Model | None:
@@ -99,6 +101,8 @@ class CrudServiceBase(AbstractCRUDService[Model, Crud, CreateSchema, UpdateSchem
     UpdateSchema which represents the input data for updating objects.
     """
 
+    __slots__ = ("crud",)
+
     def __init__(self, crud: Crud):
         self.crud: Crud = crud
 
@@ -107,17 +111,14 @@ class CrudServiceBase(AbstractCRUDService[Model, Crud, CreateSchema, UpdateSchem
         return await self.crud.get(uuid, include_removed)
 
     async def get_all(self, include_removed: bool = False) -> list[Row[Model]] | None:
-        all_objects = await self.crud.get_all(include_removed)
-        if len(all_objects) == 0:
-            return []
-        return all_objects
+        return await self.crud.get_all(include_removed)
 
     async def create(self, obj_in: CreateSchema) -> Model | None:
         return await self.crud.create(obj_in)
 
     async def update(self, uuid: UUID | str | int,
                obj_in: UpdateSchema) -> Model | None:
-        obj_to_update = await self.get(uuid)
+        obj_to_update = await self.crud.get_by_id(uuid)
         if obj_to_update is None:
             return None
         return await self.crud.update(db_obj=obj_to_update, obj_in=obj_in)
@@ -8,6 +8,8 @@ from fastapi import Depends
 from db import db_session
 from crud import CRUDUser, CRUDReservationService
 from services import CrudServiceBase
+from services.cache import reservation_service_aliases_cache, ALIASES_KEY
+from services.utils import service_availability_check
 from models import UserModel
 from schemas import UserCreate, UserUpdate, User, UserIS, Role, ServiceValidity, \
     Room
@@ -25,6 +27,8 @@ class AbstractUserService(CrudServiceBase[
     that provides CRUD operations for a specific UserModel.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def create_user(
             self, user_data: UserIS,
@@ -53,12 +57,24 @@ class AbstractUserService(CrudServiceBase[
         :return: The User instance if found, None otherwise.
         """
 
+    @abstractmethod
+    async def get_with_events(self, user_id: int) -> UserModel | None:
+        """
+        Retrieves a User instance by its id together with its events.
+
+        :param user_id: The id of the User.
+
+        :return: The User instance if found, None otherwise.
+        """
+
 
 class UserService(AbstractUserService):
     """
     Class UserService represent service that work with User
     """
 
+    __slots__ = ("reservation_service_crud",)
+
     def __init__(self, db: Annotated[
         AsyncSession, Depends(db_session.scoped_session_dependency)]):
         self.reservation_service_crud = CRUDReservationService(db)
@@ -70,35 +86,25 @@ class UserService(AbstractUserService):
             services: list[ServiceValidity],
             room: Room
     ) -> UserModel:
-        user = await self.get_by_username(user_data.username)
-
         user_roles = []
 
-        for role in roles:
-            if role.role == "service_admin":
-                for manager in role.limit_objects:
-                    if manager.alias in await self.reservation_service_crud.get_all_aliases():
-                        user_roles.append(manager.alias)
+        managed = [manager.alias for role in roles if role.role == "service_admin"
+                   for manager in role.limit_objects]
+        if managed:
+            # Aliases are loaded once, not for every managed object
+            aliases = reservation_service_aliases_cache.get(ALIASES_KEY)
+            if aliases is None:
+                aliases = frozenset(await self.reservation_service_crud.get_all_aliases())
+                reservation_service_aliases_cache.set(ALIASES_KEY, aliases)
+            user_roles = [alias for alias in managed if alias in aliases]
 
-        active_member = False
-        for service in services:
-            if service.service.alias == "active":
-                active_member = True
+        active_member = service_availability_check(services, "active")
 
         section_head = False
         if user_data.note.strip() == "head":
             active_member = True
             section_head = True
 
-        if user:
-            user_update = UserUpdate(
-                room_number=room.door_number,
-                active_member=active_member,
-                section_head=section_head,
-                roles=user_roles,
-            )
-            return await self.update(user.id, user_update)
-
         user_create = UserCreate(
             id=user_data.id,
             username=user_data.username,
@@ -108,7 +114,13 @@ class UserService(AbstractUserService):
             section_head=section_head,
             roles=user_roles,
         )
-        return await self.crud.create(user_create)
+        # Existing user keeps its id and full name, the rest comes from IS
+        return await self.crud.upsert_by_username(
+            user_create.model_dump(),
+            ("room_number", "active_member", "section_head", "roles"))
 
     async def get_by_username(self, username: str) -> UserModel:
         return await self.crud.get_by_username(username)
+
+    async def get_with_events(self, user_id: int) -> UserModel | None:
+        return await self.crud.get_with_events(user_id)
@@ -1,17 +1,23 @@
 """
 Utils for services.
 """
+import base64
 import datetime as dt
+import orjson
 from pytz import timezone
 
 from models import CalendarModel, ReservationServiceModel
 from schemas import Rules, EventCreate, ServiceValidity, User
 
+# Time zone of the reservations, looked up once
+_PRAGUE = timezone("Europe/Prague")
+
 
 def first_standard_check(
         services: list[ServiceValidity],
         reservation_service: ReservationServiceModel,
-        start_time, end_time
+        start_time, end_time,
+        now: dt.datetime | None = None
 ):
     """
     Checking if the user is reserving the service user has
@@ -21,6 +27,7 @@ def first_standard_check(
     :param reservation_service: Reservation Service object in db.
     :param start_time: Start time of the reservation.
     :param end_time: End time of the reservation.
+    :param now: Current time, taken from the clock if not given.
 
     :return: True indicating if the reservation
     is made rightly or message if not.
@@ -30,7 +37,7 @@ def first_standard_check(
         return {"message": f"You don't have {reservation_service.alias} service!"}
 
     # Check error reservation
-    if start_time < dt.datetime.now():
+    if start_time < (now or dt.datetime.now()):
         return {"message": "You can't make a reservation before the present time!"}
 
     if end_time < start_time:
@@ -39,25 +46,28 @@ def first_standard_check(
     return "Access"
 
 
-def reservation_in_advance(start_time, user_rules):
+def reservation_in_advance(start_time, user_rules, now: dt.datetime | None = None):
     """
     Check if the reservation is made within the specified advance and prior time.
 
     :param start_time: Start time of the reservation.
     :param user_rules: Rules object containing reservation rules.
     reservation is made in advance or in prior.
+    :param now: Current time, taken from the clock if not given.
 
     :return: True indicating if the reservation
     is made within the specified advance or prior time or message if not.
     """
+    now = now or dt.datetime.now()
+
     # Reservation in advance
-    if not control_res_in_advance_or_prior(start_time, user_rules, True):
+    if not control_res_in_advance_or_prior(start_time, user_rules, True, now):
         return {"message": f"You have to make reservations "
                            f"{user_rules.in_advance_hours} hours and "
                            f"{user_rules.in_advance_minutes} minutes in advance!"}
 
     # Reservation prior than
-    if not control_res_in_advance_or_prior(start_time, user_rules, False):
+    if not control_res_in_advance_or_prior(start_time, user_rules, False, now):
         return {"message": f"You can't make reservations earlier than "
                            f"{user_rules.in_prior_days} days "
                            f"in advance!"}
@@ -77,13 +87,14 @@ def dif_days_res(start_datetime, end_datetime, user_rules: Rules) -> bool:
     """
 
     time_difference = abs(end_datetime - start_datetime)
-    if time_difference > dt.timedelta(hours=user_rules.max_reservation_hours):
+    if time_difference > user_rules.max_duration_delta:
         return False
     return True
 
 
 def control_res_in_advance_or_prior(start_time, user_rules: Rules,
-                                    in_advance: bool) -> bool:
+                                    in_advance: bool,
+                                    now: dt.datetime | None = None) -> bool:
     """
     Check if the reservation is made within the specified advance or prior time.
 
@@ -91,21 +102,22 @@ def control_res_in_advance_or_prior(start_time, user_rules: Rules,
     :param user_rules: Rules object containing reservation rules.
     :param in_advance: Boolean indicating whether to check if the
     reservation is made in advance or in prior.
+    :param now: Current time, taken from the clock if not given.
 
     :return: Boolean indicating if the reservation
     is made within the specified advance or prior time.
     """
 
-    current_time = dt.datetime.now()
+    current_time = now or dt.datetime.now()
 
-    time_difference = abs(start_time - current_time)
+    # Signed, so a start in the past is never in advance
+    time_difference = start_time - current_time
 
     if in_advance:
-        if time_difference < dt.timedelta(minutes=user_rules.in_advance_minutes,
-                                          hours=user_rules.in_advance_hours):
+        if time_difference < user_rules.advance_delta:
             return False
     else:
-        if time_difference > dt.timedelta(days=user_rules.in_prior_days):
+        if time_difference > user_rules.prior_delta:
             return False
     return True
 
@@ -147,11 +159,8 @@ def ready_event(
 
     :return: Dict body of the event.
     """
-
-    prague = timezone("Europe/Prague")
-
-    start_time = prague.localize(event_input.start_datetime).isoformat()
-    end_time = prague.localize(event_input.end_datetime).isoformat()
+    start_time = _PRAGUE.localize(event_input.start_datetime).isoformat()
+    end_time = _PRAGUE.localize(event_input.end_datetime).isoformat()
     return {
         "summary": calendar.reservation_type,
         "description": description_of_event(user, event_input),
@@ -184,3 +193,32 @@ def service_availability_check(services: list[ServiceValidity],
         if service.service.alias == service_alias:
             return True
     return False
+
+
+def encode_events_cursor(start_datetime: dt.datetime, event_id: str) -> str:
+    """
+    Encode position of the last event of the page into the cursor.
+
+    :param start_datetime: Start datetime of the last event.
+    :param event_id: Id of the last event.
+
+    :return: Cursor of the next page.
+    """
+    return base64.urlsafe_b64encode(
+        orjson.dumps([start_datetime.isoformat(), event_id])).decode()
+
+
+def decode_events_cursor(cursor: str) -> tuple[dt.datetime, str]:
+    """
+    Decode position of the last event of the previous page from the cursor.
+
+    :param cursor: Cursor of the page.
+
+    :return: Start datetime and id of the last event of the previous page.
+    :raises ValueError: If the cursor is not valid.
+    """
+    try:
+        start_datetime, event_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return dt.datetime.fromisoformat(start_datetime), str(event_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor.") from exc
@@ -2,11 +2,14 @@
 Fixtures for setting up and tearing down the test PostgreSQL database using testcontainers.
 Provides async sessions for tests, with schema management.
 """
-from urllib.parse import urlparse, urlunparse
+import os
 
 import pytest_asyncio
 from testcontainers.postgres import PostgresContainer
+import pytest
+from sqlalchemy import URL, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
 
 from db import Base
 
@@ -18,24 +21,35 @@ from db import Base
 class TestDatabaseSession:
     """
     Manages async engine and session for PostgreSQL test container.
+    The emitted SQL is logged only when SQLA_ECHO=1 is set.
     """
 
     def __init__(self, container: PostgresContainer):
-        raw_url = str(container.get_connection_url())
-        parsed_url = urlparse(raw_url)
-
-        # Replace scheme to use asyncpg driver
-        async_url = urlunparse(parsed_url._replace(scheme="postgresql+asyncpg"))
+        async_url = URL.create(
+            "postgresql+asyncpg",
+            username=container.username,
+            password=container.password,
+            host=container.get_container_host_ip(),
+            port=int(container.get_exposed_port(container.port)),
+            database=container.dbname,
+        )
 
+        # Every test runs in its own event loop and asyncpg connections
+        # can't move between loops, so the engine is shared but not its connections
         self.engine = create_async_engine(
             async_url,
-            echo=True,
+            poolclass=NullPool,
+            echo=os.getenv("SQLA_ECHO") == "1",
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        self.schema_created = False
+        # Built once, the models are all imported by the time the tests run
+        tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+        self.truncate_sql = text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
 
     # @asynccontextmanager
     # async def session_dependency(self):
@@ -64,6 +78,17 @@ class TestDatabaseSession:
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
+        self.schema_created = True
+
+    async def reset(self):
+        """
+        Empties all tables, the schema is created only the first time.
+        """
+        if not self.schema_created:
+            await self.drop_and_create_all()
+            return
+        async with self.engine.begin() as conn:
+            await conn.execute(self.truncate_sql)
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -79,13 +104,21 @@ async def pg_container():
         container.stop()
 
 
+@pytest.fixture(scope="session")
+def test_database(pg_container):
+    """
+    Creates the engine of the test database once for the test session.
+    """
+    return TestDatabaseSession(pg_container)
+
+
 @pytest_asyncio.fixture(scope="function")
-async def async_session(pg_container):
+async def async_session(test_database):
     """
-    Provides a fresh database session for each test (with schema reset).
+    Provides a fresh database session for each test (with emptied tables).
     """
-    db_session = TestDatabaseSession(pg_container)
-    await db_session.drop_and_create_all()
+    db_session = test_database
+    await db_session.reset()
 
     session = await db_session.get_session()
     try:
@@ -95,11 +128,11 @@ async def async_session(pg_container):
 
 
 @pytest_asyncio.fixture(scope="function")
-async def shared_session(pg_container):
+async def shared_session(test_database):
     """
     Provides a shared schema for all tests, but new session each time.
     """
-    db_session = TestDatabaseSession(pg_container)
+    db_session = test_database
     await db_session.create_schema()
 
     session = await db_session.get_session()
@@ -48,21 +48,20 @@ async def test_get_request_success(mock_get):
 
 
 @pytest.mark.asyncio
-@patch("api.user_authenticator.get_request")
-async def test_authenticate_user(mock_get_request, user_data_from_is,
+@patch("api.user_authenticator.get_request_content")
+async def test_authenticate_user(mock_get_request_content, user_data_from_is,
                                  room_data_from_is):
     """
     Test user authentication flow with mocked data from identity service.
     """
-    mock_get_request.return_value = {"some": "response"}
     mock_user_service = AsyncMock()
     mock_user_service.create_user.return_value = "mocked_user"
 
-    mock_get_request.side_effect = [
-        user_data_from_is.model_dump(),  # /users/me
-        [],  # /user_roles/mine
-        [],  # /services/mine
-        room_data_from_is.model_dump() # /rooms/mine
+    mock_get_request_content.side_effect = [
+        user_data_from_is.model_dump_json(),  # /users/me
+        b"[]",  # /user_roles/mine
+        b"[]",  # /services/mine
+        room_data_from_is.model_dump_json() # /rooms/mine
     ]
 
     user = await authenticate_user(mock_user_service, token="dummy")
@@ -44,6 +44,61 @@ async def test_get_calendar_by_reservation_type(test_calendar_service, calendar_
     assert calendar.id == test_calendar_service.id
 
 
+@pytest.mark.asyncio
+async def test_get_many_calendars(test_calendar_service, calendar_crud):
+    """
+    Test retrieving calendars by ids in one query.
+    """
+    calendars = await calendar_crud.get_many([test_calendar_service.id, "nonexistent"])
+    assert [calendar.id for calendar in calendars] == [test_calendar_service.id]
+    assert await calendar_crud.get_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_get_calendar_with_reservation_service(test_calendar_service, calendar_crud,
+                                                     reservation_service_crud):
+    """
+    Test retrieving calendar together with its live reservation service.
+    """
+    calendar, reservation_service = await calendar_crud.get_with_reservation_service(
+        test_calendar_service.id)
+    assert calendar is test_calendar_service
+    assert reservation_service.id == test_calendar_service.reservation_service_id
+
+    await reservation_service_crud.soft_remove(reservation_service.id)
+    calendar, reservation_service = await calendar_crud.get_with_reservation_service(
+        test_calendar_service.id)
+    assert calendar is test_calendar_service
+    assert reservation_service is None
+
+    await calendar_crud.soft_remove(test_calendar_service.id)
+    assert await calendar_crud.get_with_reservation_service(test_calendar_service.id) is None
+    assert await calendar_crud.get_with_reservation_service(
+        test_calendar_service.id, include_removed=True) is not None
+
+
+@pytest.mark.asyncio
+async def test_existing_calendar_ids(test_calendar_service, calendar_crud):
+    """
+    Test retrieving which of the ids belong to existing calendars.
+    """
+    assert await calendar_crud.existing_ids(
+        [test_calendar_service.id, "nonexistent"]) == {test_calendar_service.id}
+    assert await calendar_crud.existing_ids([]) == set()
+
+
+@pytest.mark.asyncio
+async def test_exists_by_id_or_type(test_calendar_service, calendar_crud):
+    """
+    Test checking calendar conflict by id or reservation type in one query.
+    """
+    assert await calendar_crud.exists_by_id_or_type(
+        test_calendar_service.id, test_calendar_service.reservation_type) == "id"
+    assert await calendar_crud.exists_by_id_or_type(
+        "nonexistent", test_calendar_service.reservation_type) == "reservation_type"
+    assert await calendar_crud.exists_by_id_or_type("nonexistent", "nonexistent") is None
+
+
 @pytest.mark.asyncio
 async def test_get_all_calendars(test_calendar_service, calendar_crud):
     """
@@ -146,3 +201,13 @@ async def test_get_by_reservation_type_include_removed(calendar_crud, test_calen
     )
     assert calendar is not None
     assert calendar.deleted_at is not None
+
+
+@pytest.mark.asyncio
+async def test_get_calendar_by_id_from_identity_map(test_calendar_service, calendar_crud):
+    """
+    Test retrieving calendar by primary key returns the instance from the session.
+    """
+    calendar = await calendar_crud.get_by_id(test_calendar_service.id)
+    assert calendar is test_calendar_service
+    assert await calendar_crud.get_by_id(None) is None
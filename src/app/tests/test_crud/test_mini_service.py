@@ -41,6 +41,20 @@ async def test_get_mini_service_by_name(test_mini_service, mini_service_crud):
             test_mini_service.reservation_service_id)
 
 
+@pytest.mark.asyncio
+async def test_get_mini_services_by_names(mini_service_crud,
+                                          test_mini_service,
+                                          test_mini_service2):
+    """
+    Test retrieving mini services by names in one query.
+    """
+    mini_services = await mini_service_crud.get_by_names(
+        [test_mini_service.name, test_mini_service2.name, "Nonexistent"])
+    assert set(mini_services) == {test_mini_service.name, test_mini_service2.name}
+    assert mini_services[test_mini_service.name].id == test_mini_service.id
+    assert await mini_service_crud.get_by_names([]) == {}
+
+
 @pytest.mark.asyncio
 async def test_get_all_mini_services(mini_service_crud,
                                      test_mini_service,
@@ -77,6 +91,29 @@ async def test_get_names_by_reservation_service_id(mini_service_crud, test_mini_
     assert test_mini_service.name in names
 
 
+@pytest.mark.asyncio
+async def test_get_mini_service_with_reservation_service(test_mini_service, mini_service_crud,
+                                                         reservation_service_crud):
+    """
+    Test retrieving mini service together with its live reservation service.
+    """
+    mini_service, reservation_service = await mini_service_crud.get_with_reservation_service(
+        test_mini_service.id)
+    assert mini_service is test_mini_service
+    assert reservation_service.id == test_mini_service.reservation_service_id
+
+    await reservation_service_crud.soft_remove(reservation_service.id)
+    mini_service, reservation_service = await mini_service_crud.get_with_reservation_service(
+        test_mini_service.id)
+    assert mini_service is test_mini_service
+    assert reservation_service is None
+
+    await mini_service_crud.soft_remove(test_mini_service.id)
+    assert await mini_service_crud.get_with_reservation_service(test_mini_service.id) is None
+    assert await mini_service_crud.get_with_reservation_service(
+        test_mini_service.id, include_removed=True) is not None
+
+
 @pytest.mark.asyncio
 async def test_update_mini_service(test_mini_service, mini_service_crud):
     """
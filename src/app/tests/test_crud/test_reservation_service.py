@@ -51,6 +51,19 @@ async def test_get_by_alias_reservation_service(test_reservation_service, reserv
     assert service.name == test_reservation_service.name
 
 
+@pytest.mark.asyncio
+async def test_get_detail_by_alias_reservation_service(test_reservation_service,
+                                                       reservation_service_crud):
+    """
+    Test getting reservation service by alias with its relationships.
+    """
+    service = await reservation_service_crud.get_detail_by_alias("study")
+    assert service is not None
+    assert service.id == test_reservation_service.id
+    assert service.calendars == []
+    assert service.mini_services == []
+
+
 @pytest.mark.asyncio
 async def test_get_all_reservation_services(reservation_service_crud, test_reservation_service,
                                             test_reservation_service2):
@@ -65,6 +78,39 @@ async def test_get_all_reservation_services(reservation_service_crud, test_reser
     assert test_reservation_service2.name in names
 
 
+@pytest.mark.asyncio
+async def test_get_all_with_children(reservation_service_crud, mini_service_crud,
+                                     test_reservation_service, test_reservation_service2,
+                                     test_calendar_service, test_mini_service):
+    """
+    Test retrieving all reservation services with their calendars and mini services.
+    """
+    await mini_service_crud.soft_remove(test_mini_service.id)
+
+    services = {service.id: service
+                for service in await reservation_service_crud.get_all_with_children(True)}
+
+    service = services[test_reservation_service.id]
+    assert [calendar.id for calendar in service.calendars] == [test_calendar_service.id]
+    assert [mini_service.id for mini_service in service.mini_services] == \
+           [test_mini_service.id]
+    assert services[test_reservation_service2.id].calendars == []
+    assert not reservation_service_crud.db.dirty
+
+
+@pytest.mark.asyncio
+async def test_exists_by_name_or_alias(reservation_service_crud, test_reservation_service):
+    """
+    Test checking reservation service conflict by name or alias in one query.
+    """
+    assert await reservation_service_crud.exists_by_name_or_alias(
+        test_reservation_service.name, "nonexistent") == "name"
+    assert await reservation_service_crud.exists_by_name_or_alias(
+        "nonexistent", test_reservation_service.alias) == "alias"
+    assert await reservation_service_crud.exists_by_name_or_alias(
+        "nonexistent", "nonexistent") is None
+
+
 @pytest.mark.asyncio
 async def test_get_multi_reservation_services(reservation_service_crud, test_reservation_service,
                                               test_reservation_service2):
@@ -29,6 +29,37 @@ async def test_get_user_by_id(test_user, user_crud):
     assert db_user.username == "fixture_user"
 
 
+@pytest.mark.asyncio
+async def test_get_user_with_events(test_user, user_crud):
+    """
+    Test getting the user with its events loaded.
+    """
+    db_user = await user_crud.get_with_events(test_user.id)
+    assert db_user is not None
+    assert db_user.events == []
+
+
+@pytest.mark.asyncio
+async def test_user_exists(test_user, user_crud):
+    """
+    Test checking if the user exists.
+    """
+    assert await user_crud.exists(test_user.id) is True
+    assert await user_crud.exists(-1) is False
+
+
+@pytest.mark.asyncio
+async def test_get_user_summary(test_user, user_crud):
+    """
+    Test getting only id and full name of the user.
+    """
+    summary = await user_crud.get_summary(test_user.id)
+    assert summary is not None
+    assert summary.id == test_user.id
+    assert summary.full_name == test_user.full_name
+    assert await user_crud.get_summary(-1) is None
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_username(test_user, user_crud):
     """
@@ -39,6 +70,28 @@ async def test_get_user_by_username(test_user, user_crud):
     assert db_user.username == "fixture_user"
 
 
+@pytest.mark.asyncio
+async def test_upsert_user_by_username(test_user, user_crud):
+    """
+    Test upsert updating only the given fields of the user with the same username.
+    """
+    user = await user_crud.upsert_by_username({
+        "id": 9999,
+        "username": test_user.username,
+        "full_name": "Other Name",
+        "room_number": "111",
+        "active_member": False,
+        "section_head": True,
+        "roles": ["club"],
+    }, ("room_number", "active_member", "section_head", "roles"))
+    assert user.id == test_user.id
+    assert user.full_name == "Fixture Gabel"
+    assert user.room_number == "111"
+    assert user.active_member is False
+    assert user.section_head is True
+    assert user.roles == frozenset({"club"})
+
+
 @pytest.mark.asyncio
 async def test_update_user(test_user, user_crud):
     """
@@ -17,7 +17,7 @@ async def test_create_user(test_user):
     """
     assert test_user.id == 2142
     assert test_user.username == "TestUser"
-    assert test_user.roles == ["Bar", "Consoles"]
+    assert test_user.roles == frozenset({"Bar", "Consoles"})
 
 
 @pytest.mark.asyncio
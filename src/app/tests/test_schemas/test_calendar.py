@@ -1,12 +1,14 @@
 """
 Tests for Calendar Pydantic Schemas
 """
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from uuid import uuid4
 import pytest
 from pydantic import ValidationError
 from schemas.calendar import (
     Rules,
+    pack_rules,
+    unpack_rules,
     CalendarCreate,
     CalendarUpdate,
     CalendarInDBBase,
@@ -43,6 +45,15 @@ def test_calendar_create_valid(valid_rules):
     assert "calendar2" in schema.collision_with_calendar
 
 
+def test_calendar_update_interns_reservation_type():
+    """
+    Test equal reservation types share one string object.
+    """
+    first = CalendarUpdate(reservation_type="".join(["Ev", "ent"]))
+    second = CalendarUpdate(reservation_type="".join(["Eve", "nt"]))
+    assert first.reservation_type is second.reservation_type
+
+
 def test_calendar_create_invalid_max_people(valid_rules):
     """
     Test that calendar creation fails when max_people is below 1.
@@ -153,3 +164,40 @@ def test_rules_field_validation():
             in_advance_minutes=0,
             in_prior_days=0
         )
+
+
+def test_rules_pack_round_trip(valid_rules):
+    """
+    Test rules unpacked from the packed integer equal the original rules.
+    """
+    packed = pack_rules(valid_rules)
+    assert 0 <= packed < 1 << 63
+    assert unpack_rules(packed) == valid_rules
+
+
+def test_rules_deltas_follow_copy(valid_rules):
+    """
+    Test the deltas of the rules are derived again for a copy with changed fields.
+    """
+    assert valid_rules.advance_delta == timedelta(hours=2, minutes=30)
+    assert unpack_rules(pack_rules(valid_rules)).prior_delta == timedelta(days=7)
+
+    copied_rules = valid_rules.model_copy(update={"in_advance_hours": 5})
+    assert copied_rules.advance_delta == timedelta(hours=5, minutes=30)
+    assert copied_rules.max_duration_delta == timedelta(hours=4)
+    assert valid_rules.advance_delta == timedelta(hours=2, minutes=30)
+
+
+def test_rules_over_packed_width():
+    """
+    Test rules which do not fit into the packed integer are rejected.
+    """
+    with pytest.raises(ValidationError):
+        Rules(
+            night_time=True,
+            reservation_without_permission=True,
+            max_reservation_hours=1 << 15,
+            in_advance_hours=0,
+            in_advance_minutes=0,
+            in_prior_days=0
+        )
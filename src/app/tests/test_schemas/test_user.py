@@ -73,7 +73,8 @@ def test_user_in_db_base_schema():
     )
     assert user.id == 42
     assert user.deleted_at is None
-    assert user.roles == ["Bar"]
+    assert user.roles == frozenset({"Bar"})
+    assert user.model_dump()["roles"] == ["Bar"]
 
 
 def test_user_schema_extends_base():
@@ -112,3 +113,23 @@ def test_user_create_required_fields(field):
     del data[field]
     with pytest.raises(ValidationError):
         UserCreate(**data)
+
+
+def test_user_from_orm_fast():
+    """
+    Test constructing user schema from trusted ORM like object without validation.
+    """
+    orm_user = UserInDBBase(
+        id=7,
+        username="OrmUser",
+        full_name="Orm Lars",
+        room_number="101",
+        active_member=True,
+        section_head=False,
+        roles=["Bar"]
+    )
+    user = User.from_orm_fast(orm_user)
+    assert isinstance(user, User)
+    assert user.username == "OrmUser"
+    assert user.events == []
+    assert User.RESPONSE_FIELDS == tuple(User.model_fields)
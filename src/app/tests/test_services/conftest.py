@@ -23,6 +23,18 @@ from schemas import UserIS, LimitObject, Role, Service, ServiceValidity, \
 # reason: circular import issue
 
 
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """
+    Clear in-process caches of the services, the database is reset for each test.
+    """
+    from services.cache import calendar_mini_services_cache, event_listing_cache, \
+        reservation_service_aliases_cache
+    calendar_mini_services_cache.clear()
+    event_listing_cache.clear()
+    reservation_service_aliases_cache.clear()
+
+
 @pytest.fixture()
 def service_user(async_session):
     """
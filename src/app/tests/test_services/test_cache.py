@@ -0,0 +1,38 @@
+"""
+Module for testing in-process cache of services.
+"""
+from services.cache import TTLCache
+
+
+def test_ttl_cache_get_set_invalidate():
+    """
+    Test storing, reading and invalidating a cached value.
+    """
+    cache = TTLCache(ttl=60)
+    assert cache.get("calendar") is None
+    cache.set("calendar", ("Bar",))
+    assert cache.get("calendar") == ("Bar",)
+    cache.invalidate("calendar")
+    assert cache.get("calendar") is None
+
+
+def test_ttl_cache_expiration():
+    """
+    Test expired values are not returned.
+    """
+    cache = TTLCache(ttl=-1)
+    cache.set("calendar", ("Bar",))
+    assert cache.get("calendar") is None
+
+
+def test_ttl_cache_max_size():
+    """
+    Test the oldest value is dropped when the cache is full.
+    """
+    cache = TTLCache(ttl=60, max_size=2)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.set("third", 3)
+    assert cache.get("first") is None
+    assert cache.get("second") == 2
+    assert cache.get("third") == 3
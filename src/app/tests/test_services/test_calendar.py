@@ -190,6 +190,27 @@ async def test_hard_delete_calendar(service_calendar,
     assert hard_removed_service.id == calendar.id
 
 
+@pytest.mark.asyncio
+async def test_delete_calendar_removes_collisions(service_calendar,
+                                                 calendar,
+                                                 calendar_create,
+                                                 user):
+    """
+    Test deleting a calendar removes it from collisions of other calendars.
+    """
+    colliding_create = calendar_create.model_copy(update={
+        "id": "service.cal.colliding@test.zc",
+        "reservation_type": "Colliding",
+        "collision_with_calendar": [calendar.id]
+    })
+    colliding = await service_calendar.create_calendar(colliding_create, user)
+
+    await service_calendar.delete_calendar(calendar.id, user, hard_remove=False)
+
+    await service_calendar.crud.db.refresh(colliding)
+    assert colliding.collision_with_calendar == []
+
+
 @pytest.mark.asyncio
 async def test_delete_calendar_no_permission(service_calendar,
                                              calendar,
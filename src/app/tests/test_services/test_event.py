@@ -5,7 +5,7 @@ import datetime as dt
 import pytest
 
 from models import EventState
-from api import BaseAppException
+from api import BaseAppException, PermissionDeniedException
 from schemas import EventUpdate
 
 
@@ -107,6 +107,96 @@ async def test_get_event(service_event, event):
     assert fetched_event.id == event.id
 
 
+@pytest.mark.asyncio
+async def test_get_by_user_id_with_extra_details(service_event, event, user,
+                                                 calendar, reservation_service):
+    """
+    Test retrieving user events with details of their calendar, user and service.
+    """
+    events = await service_event.get_by_user_id(user.id)
+    assert [details.event.id for details in events] == [event.id]
+    assert events[0].reservation_type == calendar.reservation_type
+    assert events[0].event.user_id == user.id
+    assert events[0].event.calendar_id == calendar.id
+    assert events[0].user_name == user.full_name
+    assert events[0].reservation_service_name == reservation_service.name
+
+
+@pytest.mark.asyncio
+async def test_get_by_event_state_with_extra_details(service_event, event, user,
+                                                     reservation_service):
+    """
+    Test retrieving events of reservation service by state with their details.
+    """
+    events = await service_event.get_by_event_state_by_reservation_service_alias(
+        reservation_service.alias, event.event_state)
+    assert [details.event.id for details in events] == [event.id]
+    assert events[0].user_name == user.full_name
+    assert events[0].reservation_service_name == reservation_service.name
+
+
+@pytest.mark.asyncio
+async def test_get_page_by_user_id(service_event, event, user):
+    """
+    Test retrieving user events page by page.
+    """
+    ids = []
+    cursor = None
+    while True:
+        page = await service_event.get_page_by_user_id(user.id, 1, cursor)
+        assert len(page.items) <= 1
+        ids.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert event.id in ids
+    assert len(ids) == len(set(ids))
+
+    with pytest.raises(BaseAppException):
+        await service_event.get_page_by_user_id(user.id, 1, "not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_event_listing_cache_cleared_on_change(service_event, event, user,
+                                                     reservation_service):
+    """
+    Test cached listing of events by state is dropped when an event changes.
+    """
+    confirmed = await service_event.get_by_event_state_by_reservation_service_alias(
+        reservation_service.alias, EventState.CONFIRMED)
+    assert [details.event.id for details in confirmed] == [event.id]
+
+    event.start_datetime = dt.datetime.now() + dt.timedelta(hours=1)
+    event.end_datetime = dt.datetime.now() + dt.timedelta(hours=4)
+    await service_event.cancel_event(event.id, user)
+
+    assert await service_event.get_by_event_state_by_reservation_service_alias(
+        reservation_service.alias, EventState.CONFIRMED) == []
+
+
+@pytest.mark.asyncio
+async def test_event_listing_cache_cleared_on_service_delete(service_event,
+                                                             service_reservation_service,
+                                                             event, user,
+                                                             reservation_service):
+    """
+    Test cached listing of events is dropped when their reservation service is removed.
+    """
+    alias = reservation_service.alias
+    confirmed = await service_event.get_by_event_state_by_reservation_service_alias(
+        alias, EventState.CONFIRMED)
+    assert [details.event.id for details in confirmed] == [event.id]
+
+    await service_reservation_service.delete_reservation_service(
+        reservation_service.id, user, hard_remove=False
+    )
+
+    with pytest.raises(BaseAppException):
+        await service_event.get_by_event_state_by_reservation_service_alias(
+            alias, EventState.CONFIRMED)
+
+
 @pytest.mark.asyncio
 async def test_cancel_event(service_event, event, user):
     """
@@ -179,3 +269,39 @@ async def test_confirm_event(service_event, event, user):
 
     assert confirm_event is not None
     assert confirm_event.event_state == EventState.CONFIRMED
+
+
+@pytest.mark.asyncio
+async def test_confirm_event_no_permission(service_event, event, user_not_head):
+    """
+    Test confirming an event when the user doesn't manage its reservation service.
+    """
+    event.event_state = EventState.NOT_APPROVED
+    with pytest.raises(PermissionDeniedException):
+        await service_event.confirm_event(event.id, user_not_head)
+
+    await service_event.crud.db.refresh(event)
+    assert event.event_state == EventState.NOT_APPROVED
+
+
+@pytest.mark.asyncio
+async def test_soft_removed_event_not_confirmed_or_rescheduled(service_event, event, user):
+    """
+    Test a soft removed event can't be confirmed or have its time changed.
+    """
+    event.event_state = EventState.NOT_APPROVED
+    event.start_datetime = dt.datetime.now() + dt.timedelta(hours=1)
+    event.end_datetime = dt.datetime.now() + dt.timedelta(hours=4)
+    await service_event.crud.soft_remove(event.id)
+
+    assert await service_event.confirm_event(event.id, user) is None
+
+    event_update = EventUpdate(
+        start_datetime=dt.datetime.now() + dt.timedelta(hours=3),
+        end_datetime=dt.datetime.now() + dt.timedelta(hours=6)
+    )
+    assert await service_event.request_update_reservation_time(
+        event.id, event_update, user) is None
+
+    removed_event = await service_event.crud.get(event.id, True)
+    assert removed_event.event_state == EventState.NOT_APPROVED
@@ -3,7 +3,7 @@ Module for testing mini service ser.
 """
 import pytest
 from schemas import MiniServiceUpdate
-from api import PermissionDeniedException
+from api import BaseAppException, PermissionDeniedException
 
 
 # pylint: disable=redefined-outer-name
@@ -35,6 +35,23 @@ async def test_create_mini_service_no_permission(service_mini_service,
         )
 
 
+@pytest.mark.asyncio
+async def test_create_mini_service_duplicate_name(service_mini_service,
+                                                  mini_service,
+                                                  mini_service_create,
+                                                  user):
+    """
+    Test creating a mini service with a name which already exists.
+    """
+    name = mini_service.name
+    with pytest.raises(BaseAppException):
+        await service_mini_service.create_mini_service(
+            mini_service_create, user
+        )
+
+    assert await service_mini_service.get_by_name(name) is not None
+
+
 @pytest.mark.asyncio
 async def test_get_mini_service(service_mini_service,
                                 mini_service):
@@ -147,6 +164,27 @@ async def test_hard_delete_mini_service(service_mini_service,
     assert hard_removed_service.id == mini_service.id
 
 
+@pytest.mark.asyncio
+async def test_delete_mini_service_removes_it_from_calendars(service_mini_service,
+                                                             service_calendar,
+                                                             mini_service,
+                                                             calendar_create,
+                                                             user):
+    """
+    Test deleting a mini service removes it from calendars of its reservation service.
+    """
+    calendar = await service_calendar.create_calendar(
+        calendar_create.model_copy(update={"mini_services": [mini_service.name]}), user
+    )
+
+    await service_mini_service.delete_mini_service(
+        mini_service.id, user, hard_remove=False
+    )
+
+    await service_calendar.crud.db.refresh(calendar)
+    assert calendar.mini_services == []
+
+
 @pytest.mark.asyncio
 async def test_delete_mini_service_no_permission(service_mini_service,
                                                  mini_service,
@@ -3,7 +3,8 @@ Module for testing reservation service ser.
 """
 import pytest
 from schemas import ReservationServiceUpdate
-from api import PermissionDeniedException
+from api import BaseAppException, PermissionDeniedException
+from services.cache import reservation_service_aliases_cache, ALIASES_KEY
 
 
 # pylint: disable=redefined-outer-name
@@ -37,6 +38,27 @@ async def test_create_reservation_service_no_permission(service_reservation_serv
         )
 
 
+@pytest.mark.asyncio
+async def test_create_reservation_service_duplicate(service_reservation_service,
+                                                    reservation_service,
+                                                    reservation_service_create,
+                                                    user):
+    """
+    Test creating a reservation service with a name or alias which already exists.
+    """
+    with pytest.raises(BaseAppException) as exc_info:
+        await service_reservation_service.create_reservation_service(
+            reservation_service_create.model_copy(update={"name": "Other"}), user
+        )
+    assert "alias" in exc_info.value.message
+
+    with pytest.raises(BaseAppException) as exc_info:
+        await service_reservation_service.create_reservation_service(
+            reservation_service_create, user
+        )
+    assert "name" in exc_info.value.message
+
+
 @pytest.mark.asyncio
 async def test_get_reservation_service(reservation_service,
                                        service_reservation_service):
@@ -166,6 +188,22 @@ async def test_soft_delete_reservation_service(service_reservation_service,
     assert soft_removed_service.id == reservation_service.id
 
 
+@pytest.mark.asyncio
+async def test_delete_reservation_service_invalidates_aliases(service_reservation_service,
+                                                              reservation_service,
+                                                              user):
+    """
+    Test deleting a reservation service drops the cached aliases.
+    """
+    reservation_service_aliases_cache.set(ALIASES_KEY, frozenset({reservation_service.alias}))
+
+    await service_reservation_service.delete_reservation_service(
+        reservation_service.id, user, hard_remove=False
+    )
+
+    assert reservation_service_aliases_cache.get(ALIASES_KEY) is None
+
+
 @pytest.mark.asyncio
 async def test_hard_delete_reservation_service(service_reservation_service,
                                                reservation_service,
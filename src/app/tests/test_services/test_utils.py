@@ -5,7 +5,8 @@ import datetime as dt
 import pytest
 
 from services.utils import description_of_event, reservation_in_advance, \
-    ready_event, control_res_in_advance_or_prior, dif_days_res, first_standard_check
+    ready_event, control_res_in_advance_or_prior, dif_days_res, first_standard_check, \
+    encode_events_cursor, decode_events_cursor
 
 
 # description_of_event, ready_event
@@ -84,6 +85,9 @@ def test_control_res_in_advance(rules_schema):
     start_time = dt.datetime.now() + dt.timedelta(days=1)
     result = control_res_in_advance_or_prior(start_time, rules_schema, True)
     assert result is False
+    start_time = dt.datetime.now() - dt.timedelta(days=5)
+    result = control_res_in_advance_or_prior(start_time, rules_schema, True)
+    assert result is False
 
 
 @pytest.mark.asyncio
@@ -108,6 +112,19 @@ def test_reservation_in_advance(rules_schema):
     assert result == "Access"
 
 
+@pytest.mark.asyncio
+def test_reservation_in_advance_given_now(rules_schema):
+    """
+    Test the reservation checks are made against the given time.
+    """
+    now = dt.datetime(2024, 5, 1, 12, 0)
+    start_time = dt.datetime(2024, 5, 8, 12, 0)
+    assert reservation_in_advance(start_time, rules_schema, now) == "Access"
+    assert reservation_in_advance(start_time, rules_schema,
+                                  now + dt.timedelta(days=6))["message"].startswith(
+        "You have to make reservations")
+
+
 @pytest.mark.asyncio
 def test_dif_days_res(rules_schema):
     """
@@ -126,3 +143,14 @@ def test_dif_days_res(rules_schema):
     end_time = dt.datetime.now() + dt.timedelta(hours=31)
     result = dif_days_res(start_time, end_time, rules_schema)
     assert result is True
+
+
+def test_events_cursor_round_trip():
+    """
+    Test decoding of the encoded events cursor.
+    """
+    start_time = dt.datetime(2025, 5, 15, 18, 30)
+    cursor = encode_events_cursor(start_time, "event-id")
+    assert decode_events_cursor(cursor) == (start_time, "event-id")
+    with pytest.raises(ValueError):
+        decode_events_cursor("not a cursor")